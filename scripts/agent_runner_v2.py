@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import json
@@ -795,13 +796,19 @@ def _release_local_slot(p: pathlib.Path | None) -> None:
     except Exception:
         pass
 
+# One GenAI client per process so sync and async callers share its HTTP connection pool.
+_GEMINI_CLIENT = None
+
 def get_gemini_client():
     """
     MODERN AUTHENTICATION:
     Creates a Google GenAI Client using the Service Account with explicit SCOPES.
     """
+    global _GEMINI_CLIENT
     if not SDK_AVAILABLE:
         return None
+    if _GEMINI_CLIENT is not None:
+        return _GEMINI_CLIENT
 
     if GCLOUD_KEY_FILE.exists():
         try:
@@ -819,6 +826,7 @@ def get_gemini_client():
                 project=key_info.get("project_id"),
                 location="us-central1"
             )
+            _GEMINI_CLIENT = client
             return client
         except Exception as e:
             log(f"Modern Handshake Failed: {e}")
@@ -845,9 +853,7 @@ def call_gemini_cloud_modern(prompt, retry=True, model=None):
         )
         
         if response and response.text:
-            # --- TELEMETRY LOGGING ---
-            usage = response.usage_metadata
-            log(f"USAGE | tokens_in={usage.prompt_token_count} | tokens_out={usage.candidates_token_count} | total={usage.total_token_count}")
+            _log_usage(response)
             return response.text
         else:
             if retry:
@@ -862,6 +868,44 @@ def call_gemini_cloud_modern(prompt, retry=True, model=None):
         log(f"Gemini Cloud Error: {e}")
         return None
 
+def _log_usage(response):
+    # --- TELEMETRY LOGGING ---
+    usage = response.usage_metadata
+    log(f"USAGE | tokens_in={usage.prompt_token_count} | tokens_out={usage.candidates_token_count} | total={usage.total_token_count}")
+
+async def call_gemini_cloud_modern_async(prompt, retry=True, model=None):
+    """
+    Native-async twin of call_gemini_cloud_modern (client.aio), for callers that
+    fan out several requests with asyncio.gather without a thread per call.
+    """
+    target_model = (model or "gemini-2.0-flash").strip()
+    log(f"ROUTING TO GEMINI CLOUD (Modern SDK v2.5, async) | Model: {target_model}")
+    client = get_gemini_client()
+
+    if not client:
+        log("Client initialization failed. Skipping Cloud.")
+        return None
+
+    try:
+        response = await client.aio.models.generate_content(
+            model=target_model,
+            contents=prompt
+        )
+
+        if response and response.text:
+            _log_usage(response)
+            return response.text
+        if retry:
+            log("Gemini produced empty response. Engaging 'Jiggle' Retry...")
+            await asyncio.sleep(2)
+            return await call_gemini_cloud_modern_async(f"[SYSTEM: PROVIDE SUBSTANTIVE RESPONSE NOW]\n{prompt}", retry=False, model=target_model)
+        log("CRITICAL: Gemini produced empty response after retry.")
+        return None
+
+    except Exception as e:
+        log(f"Gemini Cloud Error: {e}")
+        return None
+
 
 def _find_cli_binary(candidates):
     for name in candidates:
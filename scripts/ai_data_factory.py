@@ -44,8 +44,7 @@ def run_data_factory():
                             for i, chunk in enumerate(chunks):
                                 mem.store_memory(
                                     agent_id="data_factory",
-                                    content=f"FILE: {f_key} (Part {i})
-{chunk}",
+                                    content=f"FILE: {f_key} (Part {i})\n{chunk}",
                                     collection_name="project_data",
                                     metadata={"source": f_key, "part": i}
                                 )
@@ -56,6 +55,9 @@ def run_data_factory():
                             print(f"Error indexing {f_key}: {e}")
             
             if updated:
+                # Buffered memories must be written before their files are marked processed,
+                # or a kill in between would lose them for good.
+                mem.flush()
                 state_file.write_text(json.dumps(processed, indent=2))
                 print("Data Factory: Knowledge Base Synchronized.")
             
@@ -63,8 +65,7 @@ def run_data_factory():
             time.sleep(10)
             
     except KeyboardInterrupt:
-        print("
-Data Factory: Offline.")
+        print("\nData Factory: Offline.")
     finally:
         mem.close()
 
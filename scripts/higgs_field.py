@@ -45,8 +45,8 @@ def collapse_superposition(run_dir: Path):
         print(" -> All branches failed. Reality remains void.")
         return
 
-    # THE COLLAPSE: Select Highest Mass
-    winner = sorted(ranked_branches, key=lambda x: x['mass'], reverse=True)[0]
+    # THE COLLAPSE: Select Highest Mass (first branch wins ties, as the stable sort did)
+    winner = max(ranked_branches, key=lambda x: x['mass'])
     print(f" -> COLLAPSE: {winner['role']} selected as Reality Prime (Mass: {winner['mass']})")
     
     # Write to Observed Reality
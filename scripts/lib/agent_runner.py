@@ -1,11 +1,9 @@
 import os
 import sys
 import json
-import requests
 import pathlib
+import functools
 import datetime as dt
-import google.generativeai as genai
-import subprocess # Import subprocess for running shell commands
 
 # --- CONFIGURATION ---
 REPO_ROOT = pathlib.Path(r"C:\Users\codym\gemini-op-clean")
@@ -17,28 +15,46 @@ def log(msg):
     with open(LOG_FILE, "a", encoding="utf-8") as f:
         f.write(f"[{dt.datetime.now().isoformat()}] {msg}\n")
 
+# Heavy client libraries are imported on first use so a run that only takes
+# one route (cloud or local) never pays the import cost of the other.
+@functools.lru_cache(maxsize=None)
+def _genai():
+    import google.generativeai as genai
+    return genai
+
+@functools.lru_cache(maxsize=None)
+def _requests():
+    import requests
+    return requests
+
+# Parsed service-account credentials, reused across configure_gemini() calls.
+_GEMINI_CREDENTIALS = None
+
 def configure_gemini():
-    if GCLOUD_KEY_FILE.exists():
-        try:
+    global _GEMINI_CREDENTIALS
+    try:
+        if _GEMINI_CREDENTIALS is None:
             with open(GCLOUD_KEY_FILE, 'r') as f:
                 credentials_info = json.load(f)
-            credentials = genai.Credentials.from_service_account_info(credentials_info)
-            genai.configure(credentials=credentials)
-            log("SUCCESS: Gemini configured with Service Account.")
-            return True
-        except Exception as e:
-            log(f"Service Account config failed: {e}")
+            _GEMINI_CREDENTIALS = _genai().Credentials.from_service_account_info(credentials_info)
+        _genai().configure(credentials=_GEMINI_CREDENTIALS)
+        log("SUCCESS: Gemini configured with Service Account.")
+        return True
+    except FileNotFoundError:
+        return False
+    except Exception as e:
+        log(f"Service Account config failed: {e}")
     return False
 
 def call_gemini_cloud_sdk(prompt):
     log("ROUTING TO GEMINI CLOUD (SDK / Service Account)")
-    model = genai.GenerativeModel('gemini-1.5-flash-latest') # Use latest flash for speed
+    model = _genai().GenerativeModel('gemini-1.5-flash-latest') # Use latest flash for speed
     response = model.generate_content(prompt)
     return response.text
 
 def call_ollama(prompt, model_name):
     log(f"ROUTING TO LOCAL OLLAMA: {model_name}")
-    resp = requests.post("http://localhost:11434/api/generate", json={"model": model_name, "prompt": prompt, "stream": False}, timeout=1200)
+    resp = _requests().post("http://localhost:11434/api/generate", json={"model": model_name, "prompt": prompt, "stream": False}, timeout=1200)
     resp.raise_for_status()
     return resp.json().get("response", "")
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
 import json
 import math
@@ -9,6 +10,11 @@ import re
 import time
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 KEYWORD_WEIGHTS = {
     "architecture": 40.0,
@@ -26,16 +32,28 @@ KEYWORD_WEIGHTS = {
     "tests": 20.0,
 }
 
-CONSTRAINT_RE = re.compile(
-    r"(?i)\b(must|must not|should|should not|required|requirement|constraint|never|always|exactly|at least|without)\b"
+# Bullets, file references and constraint words counted in one scan. Bullets are
+# anchored to line starts; file refs win over constraint words inside a path.
+STRUCTURE_RE = re.compile(
+    r"(?P<bullet>^[^\S\r\n]*(?:[-*]|\d+\.)[^\S\r\n]+)"
+    r"|(?P<file>\b[\w\-./\\]+\.(?:py|ps1|md|json|toml|yaml|yml|txt)\b)"
+    r"|(?P<constraint>\b(?:must|must not|should|should not|required|requirement|constraint|never|always|exactly|at least|without)\b)",
+    re.IGNORECASE | re.MULTILINE,
 )
-FILE_RE = re.compile(r"(?i)\b[\w\-./\\]+\.(py|ps1|md|json|toml|yaml|yml|txt)\b")
 
 
 def _tokenize(text: str) -> list[str]:
     return re.findall(r"\S+", text or "")
 
 
+def _structure_counts(prompt: str) -> tuple[int, int, int]:
+    """Return (constraint, file_ref, bullet_line) counts from a single pass."""
+    counts = {"constraint": 0, "file": 0, "bullet": 0}
+    for m in STRUCTURE_RE.finditer(prompt):
+        counts[m.lastgroup] += 1
+    return counts["constraint"], counts["file"], counts["bullet"]
+
+
 def estimate_mass(prompt: str) -> float:
     tokens = _tokenize(prompt)
     if not tokens:
@@ -44,9 +62,9 @@ def estimate_mass(prompt: str) -> float:
     for tok in tokens:
         norm = tok.lower().strip(".,!?;:\"'()[]{}")
         mass += KEYWORD_WEIGHTS.get(norm, 0.0)
-    mass += 12.0 * len(CONSTRAINT_RE.findall(prompt))
-    mass += 10.0 * len(FILE_RE.findall(prompt))
-    bullet_lines = sum(1 for ln in prompt.splitlines() if re.match(r"^\s*([-*]|\d+\.)\s+", ln))
+    constraints, file_refs, bullet_lines = _structure_counts(prompt)
+    mass += 12.0 * constraints
+    mass += 10.0 * file_refs
     mass += 6.0 * float(bullet_lines)
     return round(mass, 3)
 
@@ -58,9 +76,9 @@ def mass_breakdown(prompt: str) -> dict[str, float]:
     for tok in tokens:
         norm = tok.lower().strip(".,!?;:\"'()[]{}")
         keyword_mass += float(KEYWORD_WEIGHTS.get(norm, 0.0))
-    constraint_mass = float(12.0 * len(CONSTRAINT_RE.findall(prompt)))
-    file_ref_mass = float(10.0 * len(FILE_RE.findall(prompt)))
-    bullet_lines = sum(1 for ln in prompt.splitlines() if re.match(r"^\s*([-*]|\d+\.)\s+", ln))
+    constraints, file_refs, bullet_lines = _structure_counts(prompt)
+    constraint_mass = float(12.0 * constraints)
+    file_ref_mass = float(10.0 * file_refs)
     structure_mass = float(6.0 * bullet_lines)
     total = round(token_mass + keyword_mass + constraint_mass + file_ref_mass + structure_mass, 3)
     return {
@@ -73,14 +91,15 @@ def mass_breakdown(prompt: str) -> dict[str, float]:
     }
 
 
-def _segment_prompt(prompt: str) -> list[str]:
-    blocks = [b.strip() for b in re.split(r"\n\s*\n", prompt) if b.strip()]
+@functools.lru_cache(maxsize=4)
+def _segment_prompt(prompt: str) -> tuple[str, ...]:
+    blocks = tuple(b.strip() for b in re.split(r"\n\s*\n", prompt) if b.strip())
     if len(blocks) >= 2:
         return blocks
-    sentences = [s.strip() for s in re.split(r"(?<=[.!?])\s+", prompt) if s.strip()]
+    sentences = tuple(s.strip() for s in re.split(r"(?<=[.!?])\s+", prompt) if s.strip())
     if len(sentences) >= 2:
         return sentences
-    return [prompt.strip()] if prompt.strip() else []
+    return (prompt.strip(),) if prompt.strip() else ()
 
 
 def _fallback_chunk(prompt: str, shards: int) -> list[str]:
@@ -94,14 +113,16 @@ def _fallback_chunk(prompt: str, shards: int) -> list[str]:
     return [x for x in out if x]
 
 
-def split_prompt(prompt: str, shard_count: int) -> list[str]:
+def split_prompt(prompt: str, shard_count: int, total_mass: float | None = None) -> list[str]:
     if shard_count <= 1:
         return [prompt.strip()] if prompt.strip() else []
     segments = _segment_prompt(prompt)
     if len(segments) <= 1:
         return _fallback_chunk(prompt, shard_count)
 
-    target_mass = max(1.0, estimate_mass(prompt) / float(shard_count))
+    if total_mass is None:
+        total_mass = estimate_mass(prompt)
+    target_mass = max(1.0, total_mass / float(shard_count))
     shards: list[str] = []
     cur: list[str] = []
     cur_mass = 0.0
@@ -127,11 +148,18 @@ def split_prompt(prompt: str, shard_count: int) -> list[str]:
 
 def _write_state(run_dir: Path, payload: dict) -> None:
     state_dir = run_dir / "state"
-    state_dir.mkdir(parents=True, exist_ok=True)
+    if not state_dir.is_dir():
+        state_dir.mkdir(parents=True, exist_ok=True)
     out = dict(payload)
     out["ts"] = time.time()
     out_path = state_dir / "event_horizon.json"
-    out_path.write_text(json.dumps(out, indent=2), encoding="utf-8")
+    # Serialize straight into the file handle rather than via an intermediate str.
+    if orjson is not None:
+        with out_path.open("wb") as f:
+            f.write(orjson.dumps(out, option=orjson.OPT_INDENT_2))
+        return
+    with out_path.open("w", encoding="utf-8") as f:
+        json.dump(out, f, indent=2)
 
 
 def main() -> None:
@@ -182,7 +210,7 @@ def main() -> None:
         shard_count = 1
     shard_count = min(max(1, shard_count), max(2, int(args.max_shards)))
 
-    shards = split_prompt(prompt, shard_count) if split_required else []
+    shards = split_prompt(prompt, shard_count, total_mass=mass) if split_required else []
     if split_required and len(shards) < 2:
         shards = _fallback_chunk(prompt, shard_count)
     if split_required and len(shards) < 2:
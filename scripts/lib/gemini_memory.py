@@ -1,4 +1,6 @@
 import argparse
+import os
+from collections import deque
 from pathlib import Path
 
 MEM_PATH = Path(r"C:\Users\codym\.Gemini\memory.md")
@@ -22,11 +24,16 @@ def main():
             handle.write(f"- {args.append.strip()}\n")
 
     if args.compact and MEM_PATH.exists():
-        lines = [ln for ln in MEM_PATH.read_text(encoding="utf-8", errors="ignore").splitlines() if ln.strip()]
-        header = ["# Gemini Memory"]
-        tail = lines[-args.compact:] if args.compact > 0 else lines
-        text = "\n".join(header + [""] + tail) + "\n"
-        MEM_PATH.write_text(text, encoding="utf-8")
+        # Stream the journal so only the kept tail is ever held in memory.
+        keep = args.compact if args.compact > 0 else None
+        with MEM_PATH.open("r", encoding="utf-8", errors="ignore") as handle:
+            tail = deque((ln.rstrip("\r\n") for ln in handle if ln.strip()), maxlen=keep)
+        tmp_path = MEM_PATH.with_name(MEM_PATH.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            handle.write("# Gemini Memory\n\n")
+            for ln in tail:
+                handle.write(ln + "\n")
+        os.replace(tmp_path, MEM_PATH)
 
     if args.show or (not args.append and not args.init):
         if MEM_PATH.exists():
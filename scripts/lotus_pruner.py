@@ -1,4 +1,5 @@
 import argparse
+import heapq
 import os
 import json
 from pathlib import Path
@@ -28,21 +29,22 @@ def prune_context(run_dir: Path, max_rounds_to_keep: int = 2):
         return
 
     # Determine which rounds to forget
-    sorted_rounds = sorted(rounds.keys(), reverse=True)
-    if len(sorted_rounds) <= max_rounds_to_keep:
-        print(f"[Lotus] Memory is clear ({len(sorted_rounds)} active rounds). No pruning needed.")
+    if len(rounds) <= max_rounds_to_keep:
+        print(f"[Lotus] Memory is clear ({len(rounds)} active rounds). No pruning needed.")
         return
 
-    rounds_to_forget = sorted_rounds[max_rounds_to_keep:]
+    keep_set = set(heapq.nlargest(max_rounds_to_keep, rounds))
+    rounds_to_forget = [r for r in rounds if r not in keep_set]
     
     print(f"[Lotus] Pruning rounds {rounds_to_forget} to free up context...")
     
+    moved = []
     for r in rounds_to_forget:
         for f in rounds[r]:
             # Move to history
-            dest = lotus_dir / f.name
-            os.replace(f, dest)
-            print(f" -> {f.name} sent to history.")
+            os.replace(f, lotus_dir / f.name)
+            moved.append(f.name)
+    print(f" -> {len(moved)} file(s) sent to history: {', '.join(moved)}")
 
 def main():
     parser = argparse.ArgumentParser(description="Lotus Flower: Context & Memory Management.")
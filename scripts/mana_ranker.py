@@ -3,8 +3,29 @@ import json
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 MANA_DB = Path("data/mana_registry.json")
 
+def _load_registry() -> dict:
+    if not MANA_DB.exists():
+        return {"agents": {}}
+    if orjson is not None:
+        return orjson.loads(MANA_DB.read_bytes())
+    with MANA_DB.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _save_registry(registry: dict) -> None:
+    MANA_DB.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        MANA_DB.write_bytes(orjson.dumps(registry, option=orjson.OPT_INDENT_2))
+        return
+    with MANA_DB.open("w", encoding="utf-8") as f:
+        json.dump(registry, f, indent=2)
+
 def update_mana(run_dir: Path):
     """
     Analyzes the learning summary and updates agent Mana (Trust Scores).
@@ -20,21 +41,22 @@ def update_mana(run_dir: Path):
         return
 
     # Load existing registry
-    if MANA_DB.exists():
-        registry = json.loads(MANA_DB.read_text(encoding='utf-8'))
-    else:
-        registry = {"agents": {}}
+    registry = _load_registry()
+    agents = registry["agents"]
+    get_agent = agents.get
+    dirty = False
 
     # Update agents found in the run
     # (Extracting roles from the run artifacts)
     for f in run_dir.glob("agent*.md"):
         agent_id = f.stem.replace("agent", "")
         # For PoC, we map agent IDs. In production, we map Role Names.
-        if agent_id not in registry["agents"]:
-            registry["agents"][agent_id] = {"mana": 50, "runs": 0}
-        
-        cur = registry["agents"][agent_id]
+        cur = get_agent(agent_id)
+        if cur is None:
+            cur = agents[agent_id] = {"mana": 50, "runs": 0}
+
         cur["runs"] += 1
+        dirty = True
         
         # Merit-based adjustment
         if avg_score >= 90:
@@ -46,8 +68,9 @@ def update_mana(run_dir: Path):
         cur["mana"] = max(0, min(100, cur["mana"]))
         print(f"[Mana] Agent {agent_id} now at level {cur['mana']}.")
 
-    MANA_DB.parent.mkdir(parents=True, exist_ok=True)
-    MANA_DB.write_text(json.dumps(registry, indent=2), encoding="utf-8")
+    # Nothing touched: leave the registry file as it is.
+    if dirty:
+        _save_registry(registry)
 
 def main():
     parser = argparse.ArgumentParser(description="Mana Ranker: Dynamic Agent Reputation.")
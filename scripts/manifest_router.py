@@ -1,65 +1,78 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 
 def _now() -> float:
     return time.time()
 
 
-def _round_plan(pattern: str, max_rounds: int) -> List[Dict[str, Any]]:
+RoundSpec = Tuple[int, str, Tuple[str, ...]]
+
+_DEBATE_ROUNDS: Tuple[RoundSpec, ...] = (
+    (
+        1,
+        "Diverge: propose best options with acceptance + key risks.",
+        ("round*_agent*.md", "DECISION_JSON(per seat)"),
+    ),
+    (
+        2,
+        "Cross-exam + converge: pick top plan and verification commands.",
+        ("round*_agent*.md", "DECISION_JSON(per seat)"),
+    ),
+    (
+        3,
+        "Implement: produce clean unified diffs and verify commands.",
+        ("```diff blocks", "DECISION_JSON(files,commands)"),
+    ),
+    (
+        4,
+        "Verify + repair: run verify pipeline; fix failures with patches.",
+        ("verify_pipeline ok", "patch_apply report"),
+    ),
+)
+
+_SINGLE_ROUNDS: Tuple[RoundSpec, ...] = (
+    (
+        1,
+        "Single-pass completion with verification commands.",
+        ("agent*.md", "DECISION_JSON"),
+    ),
+)
+
+_VOTING_ROUNDS: Tuple[RoundSpec, ...] = (
+    (
+        1,
+        "Propose options + score; include acceptance + verification.",
+        ("round*_agent*.md", "DECISION_JSON(per seat)"),
+    ),
+    (
+        2,
+        "Vote + finalize: produce a single plan + commands.",
+        ("round*_agent*.md", "decision summary"),
+    ),
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _round_plan(pattern: str, max_rounds: int) -> Tuple[RoundSpec, ...]:
     pat = (pattern or "").strip().lower()
     mr = max(1, int(max_rounds or 1))
     if pat == "debate":
-        base = [
-            {
-                "round": 1,
-                "goal": "Diverge: propose best options with acceptance + key risks.",
-                "required_artifacts": ["round*_agent*.md", "DECISION_JSON(per seat)"],
-            },
-            {
-                "round": 2,
-                "goal": "Cross-exam + converge: pick top plan and verification commands.",
-                "required_artifacts": ["round*_agent*.md", "DECISION_JSON(per seat)"],
-            },
-            {
-                "round": 3,
-                "goal": "Implement: produce clean unified diffs and verify commands.",
-                "required_artifacts": ["```diff blocks", "DECISION_JSON(files,commands)"],
-            },
-            {
-                "round": 4,
-                "goal": "Verify + repair: run verify pipeline; fix failures with patches.",
-                "required_artifacts": ["verify_pipeline ok", "patch_apply report"],
-            },
-        ]
-        return base[:mr]
+        return _DEBATE_ROUNDS[:mr]
     if pat == "single":
-        return [
-            {
-                "round": 1,
-                "goal": "Single-pass completion with verification commands.",
-                "required_artifacts": ["agent*.md", "DECISION_JSON"],
-            }
-        ]
+        return _SINGLE_ROUNDS
     # voting / unknown
-    base = [
-        {
-            "round": 1,
-            "goal": "Propose options + score; include acceptance + verification.",
-            "required_artifacts": ["round*_agent*.md", "DECISION_JSON(per seat)"],
-        },
-        {
-            "round": 2,
-            "goal": "Vote + finalize: produce a single plan + commands.",
-            "required_artifacts": ["round*_agent*.md", "decision summary"],
-        },
-    ]
-    return base[:mr]
+    return _VOTING_ROUNDS[:mr]
+
+
+def _round_dicts(plan: Tuple[RoundSpec, ...]) -> List[Dict[str, Any]]:
+    return [{"round": rn, "goal": goal, "required_artifacts": list(artifacts)} for rn, goal, artifacts in plan]
 
 def _default_service_router(*, online: bool) -> Dict[str, Any]:
     """
@@ -139,6 +152,7 @@ def main() -> int:
     ap.add_argument("--require-approval", action="store_true", help="Require HITL approval before sensitive actions (ex: patch apply).")
     ap.add_argument("--require-grounding", action="store_true", help="Require grounding citations before applying patches.")
     ap.add_argument("--contract-repair-attempts", type=int, default=1)
+    ap.add_argument("--emit-mermaid", action="store_true", help="Also write state/manifest.mmd (flowchart of the round plan).")
     args = ap.parse_args()
 
     repo_root = Path(args.repo_root).resolve()
@@ -174,13 +188,14 @@ def main() -> int:
             "require_approval": bool(args.require_approval),
             "require_grounding": bool(args.require_grounding),
         },
-        "rounds": _round_plan(str(args.pattern), int(args.max_rounds)),
+        "rounds": _round_dicts(_round_plan(str(args.pattern), int(args.max_rounds))),
         "service_router": _default_service_router(online=bool(args.online)),
     }
 
     out_path = state_dir / "manifest.json"
     out_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
-    (state_dir / "manifest.mmd").write_text(_manifest_mermaid(manifest), encoding="utf-8")
+    if args.emit_mermaid:
+        (state_dir / "manifest.mmd").write_text(_manifest_mermaid(manifest), encoding="utf-8")
     print(json.dumps({"ok": True, "manifest_path": str(out_path)}, indent=2))
     return 0
 
@@ -6,6 +6,7 @@ import json
 import os
 import subprocess
 import sys
+import threading
 from pathlib import Path
 from typing import Any, Dict
 
@@ -27,12 +28,20 @@ def write_job(payload: Dict[str, Any]) -> Path:
 
 
 def run_subprocess(cmd: list[str]) -> int:
-    cp = subprocess.run(cmd, capture_output=True, text=True, env=dict(os.environ))
-    if cp.stdout.strip():
-        print(cp.stdout.strip())
-    if cp.returncode != 0 and cp.stderr.strip():
-        print(cp.stderr.strip())
-    return cp.returncode
+    # Stream the skill's stdout as it arrives instead of buffering the whole log;
+    # stderr is drained on a side thread so neither pipe can fill up and stall the child.
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    err_chunks: list[str] = []
+    err_reader = threading.Thread(target=lambda: err_chunks.extend(proc.stderr), daemon=True)
+    err_reader.start()
+    for line in proc.stdout:
+        print(line.rstrip("\r\n"), flush=True)
+    returncode = proc.wait()
+    err_reader.join()
+    stderr = "".join(err_chunks).strip()
+    if returncode != 0 and stderr:
+        print(stderr)
+    return returncode
 
 
 def main() -> int:
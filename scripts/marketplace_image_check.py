@@ -2,32 +2,150 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
 import json
+import os
+import struct
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from PIL import Image
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_STANDARDS_PATH = REPO_ROOT / "data" / "marketplace_image_standards.json"
 
+# Fallback path only: naming the format up front lets Pillow open just that
+# plugin instead of probing every registered one.
+SUFFIX_FORMATS: Dict[str, Tuple[str, ...]] = {
+    ".png": ("PNG",),
+    ".jpg": ("JPEG",),
+    ".jpeg": ("JPEG",),
+    ".webp": ("WEBP",),
+}
+
+
+# Keyed on mtime so an edited standards file is picked up without a restart.
+@functools.lru_cache(maxsize=8)
+def _parse_standards(path: str, mtime_ns: int) -> Dict[str, Any]:
+    return json.loads(Path(path).read_text(encoding="utf-8-sig"))
+
 
 def load_standards(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(f"Standards file not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8-sig"))
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Standards file not found: {path}") from None
+    return _parse_standards(str(path), mtime_ns)
+
+
+# Pillow's mode for each PNG (bit depth, color type) pair.
+PNG_MODES: Dict[Tuple[int, int], str] = {
+    (1, 0): "1",
+    (2, 0): "L",
+    (4, 0): "L",
+    (8, 0): "L",
+    (16, 0): "I;16",
+    (8, 2): "RGB",
+    (16, 2): "RGB",
+    (1, 3): "P",
+    (2, 3): "P",
+    (4, 3): "P",
+    (8, 3): "P",
+    (8, 4): "LA",
+    (16, 4): "RGBA",
+    (8, 6): "RGBA",
+    (16, 6): "RGBA",
+}
+JPEG_MODES = {1: "L", 3: "RGB", 4: "CMYK"}
+# SOFn markers carry the frame size; C4 (DHT), C8 (JPG) and CC (DAC) share the range but do not.
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _probe_jpeg(fh: Any) -> Optional[Tuple[str, str, int, int]]:
+    fh.seek(2)
+    while True:
+        byte = fh.read(1)
+        while byte and byte != b"\xff":
+            byte = fh.read(1)
+        while byte == b"\xff":
+            byte = fh.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            continue  # standalone marker, no length field
+        seg = fh.read(2)
+        if len(seg) < 2:
+            return None
+        seg_len = struct.unpack(">H", seg)[0]
+        if seg_len < 2:
+            return None
+        if marker in JPEG_SOF_MARKERS:
+            frame = fh.read(6)
+            if len(frame) < 6:
+                return None
+            _precision, height, width, components = struct.unpack(">BHHB", frame)
+            mode = JPEG_MODES.get(components)
+            return ("jpeg", mode, width, height) if mode else None
+        fh.seek(seg_len - 2, os.SEEK_CUR)
+
+
+def _probe_header(path: Path) -> Optional[Tuple[str, str, int, int]]:
+    """(format, mode, width, height) read straight from PNG/JPEG/WebP headers, else None."""
+    with open(path, "rb") as fh:
+        head = fh.read(32)
+        if head[:8] == b"\x89PNG\r\n\x1a\n" and head[12:16] == b"IHDR" and len(head) >= 26:
+            width, height, depth, color_type = struct.unpack(">IIBB", head[16:26])
+            mode = PNG_MODES.get((depth, color_type))
+            return ("png", mode, width, height) if mode else None
+        if head[:2] == b"\xff\xd8":
+            return _probe_jpeg(fh)
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP" and len(head) >= 30:
+            chunk = head[12:16]
+            if chunk == b"VP8 " and head[23:26] == b"\x9d\x01\x2a":
+                width, height = struct.unpack("<HH", head[26:30])
+                return ("webp", "RGB", width & 0x3FFF, height & 0x3FFF)
+            if chunk == b"VP8L" and head[20] == 0x2F:
+                bits = struct.unpack("<I", head[21:25])[0]
+                has_alpha = bool((bits >> 28) & 1)
+                return ("webp", "RGBA" if has_alpha else "RGB", (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1)
+            if chunk == b"VP8X":
+                has_alpha = bool(head[20] & 0x10)
+                width = int.from_bytes(head[24:27], "little") + 1
+                height = int.from_bytes(head[27:30], "little") + 1
+                return ("webp", "RGBA" if has_alpha else "RGB", width, height)
+    return None
+
+
+def _pillow_header(path: Path) -> Tuple[str, str, int, int]:
+    # Exotic formats only; Pillow is imported here so the common path never loads it.
+    from PIL import Image, UnidentifiedImageError
+
+    img = None
+    formats = SUFFIX_FORMATS.get(path.suffix.lower())
+    if formats:
+        try:
+            img = Image.open(path, formats=formats)
+        except UnidentifiedImageError:
+            pass  # Misnamed file; let Pillow identify it the slow way.
+    if img is None:
+        img = Image.open(path)
+    with img:
+        width, height = img.size
+        return (img.format or "").lower(), img.mode, width, height
 
 
 def image_metadata(path: Path) -> Dict[str, Any]:
     if not path.exists():
-        raise FileNotFoundError(f"Image not found: {path}")
+        raise FileNotFoundError(f"Image not found: {path.resolve()}")
     file_bytes = path.stat().st_size
-    with Image.open(path) as img:
-        mode = img.mode
-        width, height = img.size
-        fmt = (img.format or "").lower()
-        has_alpha = "A" in mode
+    # Only the header is parsed here; pixel data is never loaded.
+    fmt, mode, width, height = _probe_header(path) or _pillow_header(path)
+    has_alpha = "A" in mode
     return {
         "path": str(path),
         "format": fmt,
@@ -156,29 +274,42 @@ def evaluate_against_market(
     }
 
 
-def check_image(path: Path, standards_path: Path, market: str, product: str) -> Dict[str, Any]:
-    standards = load_standards(standards_path)
+def check_image_with_standards(path: Path, standards: Dict[str, Any], market: str, product: str) -> Dict[str, Any]:
     meta = image_metadata(path)
     return evaluate_against_market(meta, standards, market=market, product=product)
 
 
+def check_image(path: Path, standards_path: Path, market: str, product: str) -> Dict[str, Any]:
+    return check_image_with_standards(path, load_standards(standards_path), market=market, product=product)
+
+
+def _error_result(image: Path, market: str, product: str, error: Exception) -> Dict[str, Any]:
+    return {
+        "status": "fail",
+        "market": market,
+        "product": product,
+        "metadata": {"path": str(image)},
+        "checks": [{"id": "runtime_error", "status": "fail", "message": str(error)}],
+    }
+
+
+def _safe_check(image: Path, standards: Dict[str, Any], market: str, product: str) -> Dict[str, Any]:
+    try:
+        return check_image_with_standards(image, standards, market=market, product=product)
+    except Exception as e:
+        return _error_result(image, market, product, e)
+
+
 def run_cli(images: List[Path], standards_path: Path, market: str, product: str, json_out: Path | None) -> int:
     results: List[Dict[str, Any]] = []
-    exit_code = 0
-    for image in images:
-        try:
-            result = check_image(image, standards_path=standards_path, market=market, product=product)
-        except Exception as e:
-            result = {
-                "status": "fail",
-                "market": market,
-                "product": product,
-                "metadata": {"path": str(image)},
-                "checks": [{"id": "runtime_error", "status": "fail", "message": str(e)}],
-            }
-        results.append(result)
-        if result.get("status") != "pass":
-            exit_code = 2
+    try:
+        standards = load_standards(standards_path)
+    except Exception as e:
+        results = [_error_result(image, market, product, e) for image in images]
+    else:
+        # Each check is a header read of a few bytes, so a serial loop beats any pool's startup.
+        results = [_safe_check(image, standards, market, product) for image in images]
+    exit_code = 2 if any(r.get("status") != "pass" for r in results) else 0
 
     payload: Dict[str, Any] = {
         "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
@@ -190,8 +321,13 @@ def run_cli(images: List[Path], standards_path: Path, market: str, product: str,
 
     if json_out is not None:
         json_out.parent.mkdir(parents=True, exist_ok=True)
-        json_out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    print(json.dumps(payload, indent=2))
+        # Serialize straight into the report file; no intermediate formatted string.
+        if orjson is not None:
+            json_out.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with json_out.open("w", encoding="utf-8") as handle:
+                json.dump(payload, handle, indent=2)
+    print(json.dumps(payload, separators=(",", ":")))
     return exit_code
 
 
@@ -204,9 +340,10 @@ def main() -> int:
     ap.add_argument("--json-out", default="")
     args = ap.parse_args()
 
-    images = [Path(p).resolve() for p in args.image]
-    standards_path = Path(args.standards).resolve()
-    json_out = Path(args.json_out).resolve() if str(args.json_out).strip() else None
+    # absolute() is pure string work; symlinks are only resolved when reporting a missing file.
+    images = [Path(p).absolute() for p in args.image]
+    standards_path = Path(args.standards).absolute()
+    json_out = Path(args.json_out).absolute() if str(args.json_out).strip() else None
     return run_cli(images, standards_path=standards_path, market=str(args.market), product=str(args.product), json_out=json_out)
 
 
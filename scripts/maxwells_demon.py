@@ -1,6 +1,7 @@
 import argparse
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Common conversational filler to remove
@@ -17,6 +18,12 @@ FILLER_PATTERNS = [
     r"It is important to note"
 ]
 
+# All fillers are deleted outright, so one alternation does the work of one pass per pattern.
+_FILLER_RE = re.compile("|".join(f"(?:{p})" for p in FILLER_PATTERNS), re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+# A "sentence" is a maximal run between ". " separators; only runs over 20 chars match.
+_DENSE_SENTENCE_RE = re.compile(r"(?:^|(?<=\. ))(?:[^.]|\.(?! )){21,}")
+
 def compress_text(text: str) -> str:
     """
     Maxwell's Demon: Artificially lowers entropy by deleting filler.
@@ -24,18 +31,15 @@ def compress_text(text: str) -> str:
     original_len = len(text)
     
     # Remove filler lines/phrases
-    for pattern in FILLER_PATTERNS:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
+    text = _FILLER_RE.sub("", text)
     
     # Simple compression: remove excessive whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RE.sub(" ", text).strip()
     
     # In a real system, this would use a transformer to summarize/vectorize
     # For now, we simulate 'dense vector' by keeping only high-signal sentences (pseudo-vectorization)
-    sentences = text.split(". ")
-    dense_sentences = [s for s in sentences if len(s) > 20] # Keep only substantial sentences
-    
-    compressed = ". ".join(dense_sentences)
+    # Keep only substantial sentences, selected in a single scan
+    compressed = ". ".join(m.group(0) for m in _DENSE_SENTENCE_RE.finditer(text))
     
     new_len = len(compressed)
     reduction = ((original_len - new_len) / original_len * 100) if original_len > 0 else 0
@@ -43,19 +47,49 @@ def compress_text(text: str) -> str:
     print(f"[Maxwell] Context Compressed: {original_len} -> {new_len} tokens ({reduction:.1f}% reduction)")
     return compressed
 
+def _vent_file(f: Path) -> None:
+    print(f"[Maxwell] Venting heat from {f.name}...")
+    content = f.read_bytes().decode('utf-8')
+    compressed = compress_text(content)
+    
+    # Write compressed version back (or to a .compressed file)
+    # The prompt says 'venting the heat... so the core can keep thinking'
+    # We'll overwrite the file so the next round's context builder sees the compressed version.
+    # Write to a sibling temp file and swap it in so a crash never leaves a half-written round.
+    tmp = f.with_suffix(f.suffix + ".tmp")
+    with open(tmp, "wb", buffering=1 << 20) as handle:
+        handle.write(compressed.encode('utf-8'))
+    os.replace(tmp, f)
+
+def round_outputs(run_dir: Path, round_num: int) -> list:
+    """Sorted round{n}_agent*.md files in run_dir, as glob() would match them."""
+    # normcase gives glob's case rules (insensitive on Windows); is_file() uses the
+    # type cached on the DirEntry, so directories are skipped without another stat.
+    prefix = os.path.normcase(f"round{round_num}_agent")
+    suffix = os.path.normcase(".md")
+    try:
+        with os.scandir(run_dir) as entries:
+            names = [
+                e.name
+                for e in entries
+                if os.path.normcase(e.name).startswith(prefix)
+                and os.path.normcase(e.name).endswith(suffix)
+                and e.is_file()
+            ]
+    except FileNotFoundError:
+        return []
+    return [run_dir / name for name in sorted(names)]
+
 def process_round_outputs(run_dir: Path, round_num: int):
     """
     Finds round outputs and applies Maxwell's Demon compression.
     """
-    for f in run_dir.glob(f"round{round_num}_agent*.md"):
-        print(f"[Maxwell] Venting heat from {f.name}...")
-        content = f.read_text(encoding='utf-8')
-        compressed = compress_text(content)
-        
-        # Write compressed version back (or to a .compressed file)
-        # The prompt says 'venting the heat... so the core can keep thinking'
-        # We'll overwrite the file so the next round's context builder sees the compressed version.
-        f.write_text(compressed, encoding='utf-8')
+    files = round_outputs(run_dir, round_num)
+    if not files:
+        return
+    # Each agent output is independent; overlap their read/write I/O.
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+        list(pool.map(_vent_file, files))
 
 def main():
     parser = argparse.ArgumentParser(description="Maxwell's Demon: Context Entropy Radiator.")
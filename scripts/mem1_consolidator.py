@@ -1,12 +1,29 @@
 import json
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 
 # Add scripts to path for agent_runner
 sys.path.append(os.path.dirname(__file__))
 from agent_runner_v2 import call_gemini_cloud_modern
+from maxwells_demon import round_outputs
+
+MEM1_TAG = "[MEM1_UPDATE]"
+MEM1_END = "COMPLETED"
+
+def _extract_update(out_file):
+    """Return the text after [MEM1_UPDATE] (up to COMPLETED or EOF), or None."""
+    try:
+        text = out_file.read_text(encoding="utf-8")
+    except Exception:
+        return None
+    start = text.find(MEM1_TAG)
+    if start < 0:
+        return None
+    start += len(MEM1_TAG)
+    end = text.find(MEM1_END, start)
+    return text[start:end if end >= 0 else len(text)].strip()
 
 def consolidate_state(run_dir_path, round_n):
     run_dir = Path(run_dir_path)
@@ -19,15 +36,12 @@ def consolidate_state(run_dir_path, round_n):
         current_state = "Mission Initialized."
 
     # Collect all updates from this round
+    out_files = round_outputs(run_dir, round_n)
     updates = []
-    for out_file in run_dir.glob(f"round{round_n}_agent*.md"):
-        try:
-            text = out_file.read_text(encoding="utf-8")
-            # Extract [MEM1_UPDATE] content
-            match = re.search(r"\[MEM1_UPDATE\](.*?)($|COMPLETED)", text, re.DOTALL | re.IGNORECASE)
-            if match:
-                updates.append(match.group(1).strip())
-        except: continue
+    if out_files:
+        # Round outputs are small independent files; read them concurrently.
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            updates = [u for u in pool.map(_extract_update, out_files) if u is not None]
 
     if not updates:
         print(f"[MEM1] No updates found in round {round_n}.")
@@ -10,6 +10,15 @@ except ImportError:
 import re
 import json
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+INGEST_BATCH_SIZE = 64
+READ_BUFFER_BYTES = 1 << 20
+
 def ingest_historical_data():
     print("--- Ingesting Historical Knowledge into Vector Memory ---")
     mem = MemoryManager()
@@ -22,23 +31,28 @@ def ingest_historical_data():
         content = lessons_path.read_text(encoding="utf-8")
         # Split by level 2 or 3 headers OR bullets to create discrete memory chunks
         chunks = re.split(r'\n(?:#{2,3}|-)\s+', content)
-        for chunk in chunks:
-            text = chunk.strip()
-            if len(text) > 30:
-                mem.store_memory(agent_id="system_ingest", content=text)
+        lessons = [text for text in (chunk.strip() for chunk in chunks) if len(text) > 30]
+        mem.store_memory_batch(agent_id="system_ingest", contents=lessons)
     
     # 2. Ingest Recent Run Summaries
     summaries_path = repo_root / "ramshare" / "state" / "learning" / "run_summaries.jsonl"
     if summaries_path.exists():
         print(f"Ingesting run summaries from {summaries_path}...")
-        with open(summaries_path, "r", encoding="utf-8") as f:
+        batch = []
+        # Large read buffer + bytes-level parsing; both json and orjson accept UTF-8 bytes.
+        with open(summaries_path, "rb", buffering=READ_BUFFER_BYTES) as f:
             for line in f:
                 try:
-                    data = json.loads(line)
+                    data = _loads(line)
                     summary = data.get("summary") or data.get("task")
                     if summary:
-                        mem.store_memory(agent_id="system_ingest", content=summary)
+                        batch.append(summary)
                 except: continue
+                if len(batch) >= INGEST_BATCH_SIZE:
+                    mem.store_memory_batch(agent_id="system_ingest", contents=batch)
+                    batch = []
+        if batch:
+            mem.store_memory_batch(agent_id="system_ingest", contents=batch)
 
     mem.close()
     print("Ingestion Complete.")
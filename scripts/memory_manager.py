@@ -1,20 +1,85 @@
 import os
 import json
+import functools
+import importlib.util
+import itertools
+import atexit
+import socket
 import sqlite3
+import threading
 import time
+import weakref
 from datetime import datetime
 
+# Monotonic Chroma ids: seeded from the wall clock once, then a plain counter so
+# ids stay unique even when many memories land within the same millisecond.
+_MEM_IDS = itertools.count(int(time.time() * 1e6))
+
+# store_memory buffers Chroma writes and flushes them in groups of this size, or from
+# a background timer this many seconds after the first buffered write.
+CHROMA_FLUSH_SIZE = 64
+CHROMA_FLUSH_INTERVAL_S = 5.0
+
+# SQLite cache writes are committed in groups: every N writes, or by a background
+# timer T seconds after the first uncommitted write so an idle process never sits on
+# the write lock.
+CACHE_COMMIT_EVERY = 32
+CACHE_COMMIT_INTERVAL_S = 2.0
+
+# Expired cache rows are swept every N cache reads (and on close) instead of per miss.
+CACHE_PURGE_EVERY = 256
+
+# Managers with buffered writes get them written at interpreter exit.
+_LIVE_MANAGERS = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers():
+    for mgr in list(_LIVE_MANAGERS):
+        mgr.flush()
+
+
+def _port_open(port, host="localhost", timeout=0.2):
+    """Cheap TCP probe so a down Docker stack is detected without importing its clients."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=1)
+def _get_embedder():
+    """One SentenceTransformer per process, shared by every MemoryManager."""
+    from sentence_transformers import SentenceTransformer
+    import logging
+    # Silence Transformers
+    logging.getLogger("sentence_transformers").setLevel(logging.ERROR)
+    logging.getLogger("transformers").setLevel(logging.ERROR)
+    
+    # Small, fast, accurate local model; pinned to CPU to skip CUDA initialization.
+    return SentenceTransformer('all-MiniLM-L6-v2', device='cpu')
+
 class MemoryManager:
     def __init__(self):
         self.use_sqlite = False
-        self.use_chroma = False
         self.redis_client = None
         self.conn = None
         self.chroma_client = None
         self.chroma_collection = None
+        self.collections = {}
+        # collection name -> (embeddings, documents, metadatas, ids) awaiting one coll.add()
+        self._pending = {}
+        self._cache_dirty = 0
+        self._cache_reads = 0
+        # The flush timer runs on its own thread, so connection use is serialized.
+        self._lock = threading.RLock()
+        self._flush_timer = None
+        _LIVE_MANAGERS.add(self)
         
         # Try connecting to Redis/Postgres (Docker Stack)
         try:
+            if not _port_open(6379):
+                raise ConnectionError("Redis not reachable on localhost:6379")
             import redis
             import psycopg2
             from pgvector.psycopg2 import register_vector
@@ -37,37 +102,44 @@ class MemoryManager:
             self.use_sqlite = True
             self.db_path = os.path.join(os.path.dirname(__file__), "../ramshare/neural_bus.db")
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self._init_sqlite()
+            # ChromaDB + the embedding model are loaded on first vector use (see use_chroma).
+
+    @functools.cached_property
+    def use_chroma(self):
+        """Open ChromaDB on first vector use so cache-only callers never import it."""
+        if not self.use_sqlite:
+            return False
+        # Same requirement as before (both libraries present) without importing torch yet.
+        if importlib.util.find_spec("sentence_transformers") is None:
+            return False
+        try:
+            import chromadb
             
-            # Try ChromaDB for vectors
-            try:
-                import chromadb
-                from sentence_transformers import SentenceTransformer
-                import logging
-                # Silence Transformers
-                logging.getLogger("sentence_transformers").setLevel(logging.ERROR)
-                logging.getLogger("transformers").setLevel(logging.ERROR)
-                
-                # Small, fast, accurate local model
-                self.embed_model = SentenceTransformer('all-MiniLM-L6-v2')
-                
-                chroma_path = os.path.join(os.path.dirname(__file__), "../ramshare/chroma_db")
-                self.chroma_client = chromadb.PersistentClient(path=chroma_path)
-                
-                # MULTI-LAYERED MEMORY
-                self.collections = {
-                    "agent_history": self.chroma_client.get_or_create_collection(name="agent_history"),
-                    "user_interactions": self.chroma_client.get_or_create_collection(name="user_interactions"),
-                    "project_data": self.chroma_client.get_or_create_collection(name="project_data")
-                }
-                # Default for backward compatibility
-                self.chroma_collection = self.collections["agent_history"]
-                self.use_chroma = True
-            except Exception:
-                pass
+            chroma_path = os.path.join(os.path.dirname(__file__), "../ramshare/chroma_db")
+            self.chroma_client = chromadb.PersistentClient(path=chroma_path)
+            
+            # MULTI-LAYERED MEMORY
+            self.collections = {
+                "agent_history": self.chroma_client.get_or_create_collection(name="agent_history"),
+                "user_interactions": self.chroma_client.get_or_create_collection(name="user_interactions"),
+                "project_data": self.chroma_client.get_or_create_collection(name="project_data")
+            }
+            # Default for backward compatibility
+            self.chroma_collection = self.collections["agent_history"]
+            return True
+        except Exception:
+            return False
+
+    @functools.cached_property
+    def embed_model(self):
+        return _get_embedder()
 
     def _init_sqlite(self):
+        # WAL lets readers proceed during writes; NORMAL sync skips the fsync per commit.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         with self.conn:
             self.conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache (
@@ -76,6 +148,7 @@ class MemoryManager:
                     expires_at REAL
                 )
             """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache(expires_at)")
             self.conn.execute("""
                 CREATE TABLE IF NOT EXISTS agent_memory (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -85,47 +158,88 @@ class MemoryManager:
                 )
             """)
 
+    def _schedule_flush(self, delay):
+        # Caller holds self._lock. One pending timer writes whatever is buffered when it fires.
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(delay, self._timed_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _timed_flush(self):
+        with self._lock:
+            self._flush_timer = None
+            self.flush()
+
+    def _note_cache_write(self):
+        self._cache_dirty += 1
+        if self._cache_dirty >= CACHE_COMMIT_EVERY:
+            self._commit_cache()
+        else:
+            self._schedule_flush(CACHE_COMMIT_INTERVAL_S)
+
+    def _commit_cache(self):
+        if self._cache_dirty and self.conn is not None:
+            self.conn.commit()
+        self._cache_dirty = 0
+
+    def _purge_expired_cache(self):
+        try:
+            cur = self.conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+            if cur.rowcount:
+                self._note_cache_write()
+        except sqlite3.Error as e:
+            print(f"[MemoryManager] Cache purge failed: {e}")
+
     def cache_response(self, key, value, ttl=3600):
         if self.use_sqlite:
+            if self.conn is None:
+                return
             expires_at = time.time() + ttl
             try:
-                with self.conn:
+                with self._lock:
                     self.conn.execute(
                         "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
                         (key, value, expires_at)
                     )
-            except Exception: pass
+                    self._note_cache_write()
+            except sqlite3.Error as e:
+                print(f"[MemoryManager] Cache write failed: {e}")
         else:
             self.redis_client.setex(key, ttl, value)
 
     def get_cached_response(self, key):
         if self.use_sqlite:
+            if self.conn is None:
+                return None
             try:
-                cur = self.conn.cursor()
-                cur.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,))
-                row = cur.fetchone()
-                if row:
-                    val, expires_at = row
-                    if time.time() < expires_at: return val
-                    else: self.conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                with self._lock:
+                    # Connection.execute reuses sqlite3's per-connection statement cache.
+                    # Expired rows simply don't match; they are swept by _purge_expired_cache.
+                    row = self.conn.execute(
+                        "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+                    ).fetchone()
+                    self._cache_reads += 1
+                    if self._cache_reads % CACHE_PURGE_EVERY == 0:
+                        self._purge_expired_cache()
+                return row[0] if row else None
+            except sqlite3.Error as e:
+                print(f"[MemoryManager] Cache read failed: {e}")
                 return None
-            except Exception: return None
         else:
             val = self.redis_client.get(key)
             return val.decode('utf-8') if val else None
 
     def store_memory(self, agent_id, content, embedding=None, metadata=None, collection_name="agent_history"):
-        """Store a memory. Uses ChromaDB for vectors if available."""
+        """Store a memory. Uses ChromaDB for vectors if available (buffered; see flush())."""
         timestamp = datetime.now().isoformat()
         
         if self.use_chroma:
             try:
-                coll = self.collections.get(collection_name, self.chroma_collection)
                 # Generate embedding locally if not provided
                 if embedding is None:
                     embedding = self.embed_model.encode(content).tolist()
                 
-                mem_id = f"mem_{int(time.time() * 1000)}"
+                mem_id = f"mem_{next(_MEM_IDS)}"
                 
                 # Enhanced Lineage Metadata
                 meta = metadata or {}
@@ -136,17 +250,22 @@ class MemoryManager:
                     "data_quality_score": 1.0 # Default for system-generated data
                 })
 
-                coll.add(
-                    embeddings=[embedding],
-                    documents=[content],
-                    metadatas=[meta],
-                    ids=[mem_id]
-                )
+                name = collection_name if collection_name in self.collections else "agent_history"
+                with self._lock:
+                    embeddings, documents, metadatas, ids = self._pending.setdefault(name, ([], [], [], []))
+                    embeddings.append(embedding)
+                    documents.append(content)
+                    metadatas.append(meta)
+                    ids.append(mem_id)
+                    if len(ids) >= CHROMA_FLUSH_SIZE:
+                        self._flush_collection(name)
+                    else:
+                        self._schedule_flush(CHROMA_FLUSH_INTERVAL_S)
             except Exception as e:
                 print(f"[MemoryManager] Chroma store failed ({collection_name}): {e}")
 
         if self.use_sqlite:
-            with self.conn:
+            with self._lock, self.conn:
                 self.conn.execute(
                     "INSERT INTO agent_memory (agent_id, content, created_at) VALUES (?, ?, ?)",
                     (agent_id, content, timestamp)
@@ -155,11 +274,78 @@ class MemoryManager:
             # Postgres logic would go here
             pass
 
+    def store_memory_batch(self, agent_id, contents, metadata=None, collection_name="agent_history"):
+        """Store several memories with a single Chroma add and a single SQLite commit."""
+        contents = [c for c in contents if c]
+        if not contents:
+            return
+        timestamp = datetime.now().isoformat()
+
+        if self.use_chroma:
+            try:
+                coll = self.collections.get(collection_name, self.chroma_collection)
+                # One encode call for the whole batch amortizes tokenizer/model launch overhead.
+                embeddings = self.embed_model.encode(
+                    contents, batch_size=64, convert_to_numpy=True, show_progress_bar=False
+                ).tolist()
+                ids = [f"mem_{next(_MEM_IDS)}" for _ in contents]
+                # Metadata is identical across the batch; build it once and copy per item.
+                meta = dict(metadata or {})
+                meta.update({
+                    "agent_id": agent_id,
+                    "ts": timestamp,
+                    "lineage_source": meta.get("run_dir", "manual_ingest"),
+                    "data_quality_score": 1.0
+                })
+                metas = [dict(meta) for _ in contents]
+
+                coll.add(
+                    embeddings=embeddings,
+                    documents=contents,
+                    metadatas=metas,
+                    ids=ids
+                )
+            except Exception as e:
+                print(f"[MemoryManager] Chroma batch store failed ({collection_name}): {e}")
+
+        if self.use_sqlite:
+            with self._lock, self.conn:
+                self.conn.executemany(
+                    "INSERT INTO agent_memory (agent_id, content, created_at) VALUES (?, ?, ?)",
+                    [(agent_id, c, timestamp) for c in contents]
+                )
+
+    def _flush_collection(self, name):
+        pending = self._pending.pop(name, None)
+        if not pending or not pending[3]:
+            return
+        embeddings, documents, metadatas, ids = pending
+        try:
+            self.collections[name].add(
+                embeddings=embeddings,
+                documents=documents,
+                metadatas=metadatas,
+                ids=ids
+            )
+        except Exception as e:
+            print(f"[MemoryManager] Chroma flush failed ({name}, {len(ids)} items): {e}")
+
+    def flush(self):
+        """Write any buffered Chroma memories and commit pending cache writes."""
+        with self._lock:
+            for name in list(self._pending):
+                self._flush_collection(name)
+            if self.use_sqlite:
+                self._commit_cache()
+
     def search_memory(self, query_text=None, query_embedding=None, limit=10, collection_name="agent_history"):
         """Semantic search using ChromaDB or Postgres."""
         if self.use_chroma:
             try:
                 coll = self.collections.get(collection_name, self.chroma_collection)
+                # Make buffered writes visible to this query.
+                with self._lock:
+                    self._flush_collection(collection_name if collection_name in self.collections else "agent_history")
                 if query_embedding is None and query_text is not None:
                     # Use local model to encode query
                     query_embedding = self.embed_model.encode(query_text).tolist()
@@ -184,5 +370,16 @@ class MemoryManager:
         return []
 
     def close(self):
-        if self.conn: self.conn.close()
+        with self._lock:
+            self.flush()
+            if self.use_sqlite and self.conn is not None:
+                self._purge_expired_cache()
+                self._commit_cache()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self.conn: self.conn.close()
+            # Closed: later flushes (timer, atexit) have nothing to write to.
+            self.conn = None
+            _LIVE_MANAGERS.discard(self)
         if self.redis_client: self.redis_client.close()
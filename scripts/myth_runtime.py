@@ -4,21 +4,51 @@ import argparse
 import json
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 
+STEP_TIMEOUT_S = 60
+TAIL_CHARS = 1200
+
+
+def _drain_tail(stream: Any, tail: deque[str]) -> None:
+    # Only the last TAIL_CHARS survive, so a noisy plugin never grows our RSS.
+    for chunk in iter(lambda: stream.read(4096), ""):
+        tail.extend(chunk)
+    stream.close()
+
+
 def _run_step(step: str, args: list[str]) -> dict[str, Any]:
     t0 = time.time()
     try:
-        cp = subprocess.run(args, capture_output=True, text=True, timeout=60, check=False)
+        proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        out_tail: deque[str] = deque(maxlen=TAIL_CHARS)
+        err_tail: deque[str] = deque(maxlen=TAIL_CHARS)
+        readers = [
+            threading.Thread(target=_drain_tail, args=(proc.stdout, out_tail), daemon=True),
+            threading.Thread(target=_drain_tail, args=(proc.stderr, err_tail), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            returncode = proc.wait(timeout=STEP_TIMEOUT_S)
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            for reader in readers:
+                reader.join()
         return {
             "step": step,
-            "ok": cp.returncode == 0,
-            "returncode": cp.returncode,
-            "stdout": (cp.stdout or "")[-1200:],
-            "stderr": (cp.stderr or "")[-1200:],
+            "ok": returncode == 0,
+            "returncode": returncode,
+            "stdout": "".join(out_tail),
+            "stderr": "".join(err_tail),
             "duration_s": round(time.time() - t0, 4),
         }
     except Exception as ex:
@@ -34,39 +64,32 @@ def _run_step(step: str, args: list[str]) -> dict[str, Any]:
 
 def run_round(repo_root: Path, run_dir: Path, query: str, round_n: int) -> dict[str, Any]:
     py = os_fspath(Path(sys.executable))
-    scripts = {
-        "hubble_drift": repo_root / "scripts" / "hubble_drift.py",
-        "wormhole_indexer": repo_root / "scripts" / "wormhole_indexer.py",
-        "dark_matter_halo": repo_root / "scripts" / "dark_matter_halo.py",
-    }
+    hubble = repo_root / "scripts" / "hubble_drift.py"
+    wormhole = repo_root / "scripts" / "wormhole_indexer.py"
+    dark_matter = repo_root / "scripts" / "dark_matter_halo.py"
+    steps = [
+        (
+            "hubble_drift",
+            hubble,
+            [py, os_fspath(hubble), "--repo-root", os_fspath(repo_root), "--run-dir", os_fspath(run_dir), "--query", query],
+        ),
+        (
+            "wormhole_indexer",
+            wormhole,
+            [py, os_fspath(wormhole), "--run-dir", os_fspath(run_dir), "--query", query, "--max-nodes", "10"],
+        ),
+        (
+            "dark_matter_halo",
+            dark_matter,
+            [py, os_fspath(dark_matter), "--run-dir", os_fspath(run_dir), "--query", query],
+        ),
+    ]
+    existing = [(name, argv) for name, path, argv in steps if path.exists()]
     results: list[dict[str, Any]] = []
-
-    p = scripts["hubble_drift"]
-    if p.exists():
-        results.append(
-            _run_step(
-                "hubble_drift",
-                [py, os_fspath(p), "--repo-root", os_fspath(repo_root), "--run-dir", os_fspath(run_dir), "--query", query],
-            )
-        )
-
-    p = scripts["wormhole_indexer"]
-    if p.exists():
-        results.append(
-            _run_step(
-                "wormhole_indexer",
-                [py, os_fspath(p), "--run-dir", os_fspath(run_dir), "--query", query, "--max-nodes", "10"],
-            )
-        )
-
-    p = scripts["dark_matter_halo"]
-    if p.exists():
-        results.append(
-            _run_step(
-                "dark_matter_halo",
-                [py, os_fspath(p), "--run-dir", os_fspath(run_dir), "--query", query],
-            )
-        )
+    if existing:
+        # Plugins share no state, so run them side by side; map() keeps the declared order.
+        with ThreadPoolExecutor(max_workers=len(existing)) as pool:
+            results = list(pool.map(lambda step: _run_step(*step), existing))
 
     ok = all(bool(r.get("ok")) for r in results) if results else True
     out = {
@@ -1,63 +1,110 @@
-import time
 import json
 import os
 from pathlib import Path
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchfiles import Change, watch
 import sys
 
 # Add scripts to path for agent_runner
 sys.path.append(os.path.dirname(__file__))
 from agent_runner_v2 import call_gemini_cloud_modern
 
-class ContextHandler(FileSystemEventHandler):
+# watchfiles groups changes until things go quiet for DEBOUNCE_S, but never holds
+# a batch longer than MAX_WAIT_S, so sustained edits are still reported.
+DEBOUNCE_S = 0.5
+MAX_WAIT_S = 5.0
+
+# Editor swap/backup/lock files that never carry real context.
+EDITOR_TEMP_SUFFIXES = (".swp", ".swx", "~", ".tmp")
+EDITOR_TEMP_NAMES = {"4913"}
+
+def _is_editor_temp(path):
+    name = os.path.basename(path)
+    return name in EDITOR_TEMP_NAMES or name.startswith(".#") or name.endswith(EDITOR_TEMP_SUFFIXES)
+
+def _context_filter(change, path):
+    return change != Change.deleted and path.endswith((".json", ".md")) and not _is_editor_temp(path)
+
+OBSERVER_PROMPT = """
+[ANTICIPATORY COMPUTING MODE]
+You are the Observer Agent. The user is actively working on the files listed at the end.
+
+TASK:
+Infer the user's current focus and intent.
+Output a valid JSON object with the current context state.
+
+OUTPUT JSON:
+{
+    "current_focus": "One sentence summary",
+    "inferred_intent": "What they are trying to achieve",
+    "proactive_suggestion": "A high-value task we could offer to do (or null if none)"
+}
+
+FILES:
+"""
+
+def _extract_json(text):
+    """First balanced {...} in text (braces inside JSON strings ignored), or None."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_str = esc = False
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_str:
+            if esc:
+                esc = False
+            elif c == "\\":
+                esc = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+class ContextHandler:
     def __init__(self, context_path):
         self.context_path = context_path
-        self.last_update = 0
-        self.buffer = []
+        self.buffer = set()
+        # path -> mtime already reported, so repeated events for one save are ignored
+        self._mtimes = {}
 
-    def on_modified(self, event):
-        if event.is_directory: return
-        if event.src_path.endswith(".json") or event.src_path.endswith(".md"):
-            self.buffer.append(event.src_path)
-            self.process_buffer()
+    def process_batch(self, paths):
+        for path in paths:
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if self._mtimes.get(path) == mtime: continue
+            self._mtimes[path] = mtime
+            self.buffer.add(path)
+        self.process_buffer()
 
     def process_buffer(self):
-        # Debounce updates (5s)
-        if time.time() - self.last_update < 5: return
-        self.last_update = time.time()
-        
-        print(f"[Observer] Context shift detected in: {len(self.buffer)} files.")
-        
+        if not self.buffer: return
         # Build prompt for Evaluator
-        changed_files = list(set(self.buffer))
-        self.buffer = [] # Clear
-        
-        prompt = f"""
-        [ANTICIPATORY COMPUTING MODE]
-        You are the Observer Agent. The user is actively working on these files:
-        {json.dumps(changed_files, indent=2)}
+        changed_files = sorted(self.buffer)
+        self.buffer = set() # Clear
         
-        TASK:
-        Infer the user's current focus and intent.
-        Output a valid JSON object with the current context state.
+        print(f"[Observer] Context shift detected in: {len(changed_files)} files.")
         
-        OUTPUT JSON:
-        {{
-            "current_focus": "One sentence summary",
-            "inferred_intent": "What they are trying to achieve",
-            "proactive_suggestion": "A high-value task we could offer to do (or null if none)"
-        }}
-        """
+        # Static instructions first, changing file list last, so the prefix is identical
+        # across calls and eligible for Gemini's implicit prefix caching.
+        prompt = OBSERVER_PROMPT + json.dumps(changed_files, indent=2) + "\n"
         
         try:
             # Use Flash for low-latency context updates
             resp = call_gemini_cloud_modern(prompt, model="gemini-2.0-flash-lite-preview-02-05")
             if resp:
-                import re
-                m = re.search(r"\{.*\}", resp, re.DOTALL)
-                if m:
-                    ctx = json.loads(m.group(0))
+                blob = _extract_json(resp)
+                if blob:
+                    ctx = json.loads(blob)
                     self.context_path.write_text(json.dumps(ctx, indent=2))
                     print(f"[Observer] Context Updated: {ctx.get('current_focus')}")
                     if ctx.get("proactive_suggestion"):
@@ -78,19 +125,22 @@ def run_observer():
     context_file = repo_root / "ramshare" / "state" / "real_time_context.json"
     handler = ContextHandler(context_file)
     
-    observer = Observer()
     for d in watch_dirs:
         d.mkdir(parents=True, exist_ok=True)
-        observer.schedule(handler, str(d), recursive=True)
         print(f"[Observer] Watching: {d.relative_to(repo_root)}")
     
-    observer.start()
+    # Native (inotify/FSEvents/ReadDirectoryChangesW) watcher; batches arrive
+    # already de-duplicated and debounced.
     try:
-        while True:
-            time.sleep(1)
+        for changes in watch(
+            *watch_dirs,
+            watch_filter=_context_filter,
+            debounce=int(MAX_WAIT_S * 1000),
+            step=int(DEBOUNCE_S * 1000),
+        ):
+            handler.process_batch([path for _, path in changes])
     except KeyboardInterrupt:
-        observer.stop()
-    observer.join()
+        pass
 
 if __name__ == "__main__":
     run_observer()
@@ -2,10 +2,15 @@ import asyncio
 import json
 import os
 from pathlib import Path
-from typing import List, Dict
+from typing import Set, Dict
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from watchfiles import awatch
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 app = FastAPI(title="Olympus Backend")
 
 def get_repo_root():
@@ -15,22 +20,38 @@ REPO_ROOT = get_repo_root()
 JOBS_DIR = REPO_ROOT / ".agent-jobs"
 IPC_DIR = REPO_ROOT / ".gemini/ipc"
 
+def _encode(message: dict) -> str:
+    # Same compact, non-ASCII-escaped text that WebSocket.send_json emits.
+    if orjson is not None:
+        try:
+            return orjson.dumps(message).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits from a lifecycle payload
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
 class HydraManager:
     """Manages the real-time WebSocket connections for the Goetic Swarm."""
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         print(f"[Hydra] New connection established. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
 
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            await connection.send_json(message)
+        if not self.active_connections:
+            return
+        # Serialize once and send to every client concurrently; a dead socket is dropped.
+        text = _encode(message)
+        connections = list(self.active_connections)
+        results = await asyncio.gather(*(c.send_text(text) for c in connections), return_exceptions=True)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 manager = HydraManager()
 
@@ -43,53 +64,93 @@ async def websocket_endpoint(websocket: WebSocket):
         
         # Start watching for system changes
         while True:
-            # We keep the connection alive
-            await asyncio.sleep(1)
+            # We keep the connection alive; reading (and ignoring) client frames
+            # surfaces a disconnect right away instead of at the next failed send.
+            await websocket.receive_text()
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
 
+# On first sight of a log, only this much of its tail is read to find the last line.
+TAIL_SEED_BYTES = 64 * 1024
+
+def _read_tail(path: Path, start: int, end: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+def _last_line(data: bytes) -> str:
+    last = data.rstrip(b"\r\n").rsplit(b"\n", 1)[-1]
+    return last.rstrip(b"\r").decode("utf-8", errors="ignore")
+
+def _new_log_line(p: Path, st: os.stat_result, offsets: Dict[str, int]):
+    """Return the last complete line appended to p since the previous event, or None."""
+    new_size = st.st_size
+    old = offsets.get(str(p), max(0, new_size - TAIL_SEED_BYTES))
+    if new_size < old:
+        old = 0  # truncated / rotated
+    offsets[str(p)] = old
+    if new_size == old:
+        return None
+    data = _read_tail(p, old, new_size)
+    end = data.rfind(b"\n")
+    if end < 0:
+        return None  # the writer is mid-line; wait for the rest of it
+    # Only complete lines are consumed; an unfinished tail is re-read next time.
+    offsets[str(p)] = old + end + 1
+    return _last_line(data[: end + 1]) or None
+
+def _parse_event(path_str: str, offsets: Dict[str, int]):
+    """Build the broadcast message for one changed path (runs on a worker thread)."""
+    p = Path(path_str)
+    try:
+        # One stat per event: st_mtime is the broadcast ts, st_size drives the log tail.
+        if p.suffix == ".status":
+            # 1. Agent Status Changes
+            st = os.stat(p)
+            return {
+                "type": "agent_update",
+                "agent": p.stem,
+                "state": p.read_text(encoding="utf-8").strip(),
+                "ts": st.st_mtime
+            }
+
+        if p.name == "triad_orchestrator.log":
+            # 2. Log Updates (Ariadne's Thread)
+            st = os.stat(p)
+            line = _new_log_line(p, st, offsets)
+            if line:
+                return {"type": "log_event", "content": line, "ts": st.st_mtime}
+
+        if p.name == "lifecycle.jsonl":
+            # 3. Lifecycle Events (Granular JSON)
+            st = os.stat(p)
+            line = _new_log_line(p, st, offsets)
+            if line:
+                return {"type": "lifecycle_event", "payload": json.loads(line), "ts": st.st_mtime}
+    except FileNotFoundError:
+        offsets.pop(path_str, None)
+    except (OSError, ValueError):
+        pass
+    return None
+
 async def watch_system_events():
     """Watches logs and IPC files to broadcast to the Hydra graph."""
     print(f"[Hydra] Watching for system events in {REPO_ROOT}")
     
+    # Byte offset already seen per log file, so each event only reads the appended bytes.
+    offsets: Dict[str, int] = {}
+
     # Watch for IPC status updates (Agent Breathing)
     async for changes in awatch(str(IPC_DIR), str(JOBS_DIR)):
-        for change_type, path_str in changes:
-            p = Path(path_str)
-            
-            # 1. Agent Status Changes
-            if p.suffix == ".status":
-                agent_name = p.stem
-                state = p.read_text(encoding="utf-8").strip()
-                await manager.broadcast({
-                    "type": "agent_update",
-                    "agent": agent_name,
-                    "state": state,
-                    "ts": os.path.getmtime(p)
-                })
-
-            # 2. Log Updates (Ariadne's Thread)
-            if p.name == "triad_orchestrator.log":
-                lines = p.read_text(encoding="utf-8", errors="ignore").splitlines()
-                if lines:
-                    await manager.broadcast({
-                        "type": "log_event",
-                        "content": lines[-1],
-                        "ts": os.path.getmtime(p)
-                    })
-
-            # 3. Lifecycle Events (Granular JSON)
-            if p.name == "lifecycle.jsonl":
-                lines = p.read_text(encoding="utf-8", errors="ignore").splitlines()
-                if lines:
-                    try:
-                        event = json.loads(lines[-1])
-                        await manager.broadcast({
-                            "type": "lifecycle_event",
-                            "payload": event,
-                            "ts": os.path.getmtime(p)
-                        })
-                    except: pass
+        # A path can show up once per change type in a batch; parse each only once.
+        paths = {path_str for _, path_str in changes}
+        # File reads happen off the event loop, one thread hop per path, all in parallel.
+        messages = await asyncio.gather(*(asyncio.to_thread(_parse_event, path_str, offsets) for path_str in paths))
+        for message in messages:
+            if message is not None:
+                await manager.broadcast(message)
 
 @app.on_event("startup")
 async def startup_event():
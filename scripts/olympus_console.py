@@ -1,7 +1,6 @@
 import streamlit as st
 import json
 import os
-import time
 import psutil
 from pathlib import Path
 import plotly.graph_objects as go
@@ -30,9 +29,11 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- Components ---
+# Live panels are fragments that refresh themselves every 5s; the rest of the page
+# (header, CSS, keyring) renders once instead of on every refresh.
 
-def draw_hydra_graph():
-    """Visualizes the Hydra Process Tree / Goetia Swarm."""
+@st.cache_resource
+def _hydra_fig():
     # Placeholder for a real node-link graph (e.g., using Graphviz or Plotly)
     fig = go.Figure(go.Scatter(
         x=[0, 1, 2, 1, 0], y=[0, 1, 0, -1, 0],
@@ -45,7 +46,34 @@ def draw_hydra_graph():
                       paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
                       xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
                       yaxis=dict(showgrid=False, zeroline=False, showticklabels=False))
-    st.plotly_chart(fig, use_container_width=True)
+    return fig
+
+def draw_hydra_graph():
+    """Visualizes the Hydra Process Tree / Goetia Swarm."""
+    # The figure is constant: built once per server process and drawn once per page
+    # run, so it is not a live fragment.
+    st.plotly_chart(_hydra_fig(), use_container_width=True)
+
+@st.cache_data(max_entries=1)
+def _load_tarot(path_str, mtime):
+    # mtime is part of the cache key, so an unchanged spread is never re-parsed.
+    return json.loads(Path(path_str).read_text(encoding="utf-8"))
+
+@st.fragment(run_every="5s")
+def draw_tarot_spread():
+    # Load and display real telemetry
+    try:
+        mtime = TAROT_SPREAD.stat().st_mtime
+    except FileNotFoundError:
+        return
+    tarot = _load_tarot(str(TAROT_SPREAD), mtime)
+    for card in tarot.get("active_cards", []):
+        st.markdown(f"""
+            <div class="tarot-card">
+                <div style="font-size: 0.8em; color: #ff00ff;">{card['suit']}</div>
+                <b>{card['name']}</b>
+            </div>
+        """, unsafe_allow_html=True)
 
 # --- Layout ---
 
@@ -101,16 +129,7 @@ with right:
     st.header("The Treasures")
     
     st.subheader("The Silicon Tarot")
-    # Load and display real telemetry
-    if TAROT_SPREAD.exists():
-        tarot = json.loads(TAROT_SPREAD.read_text(encoding="utf-8"))
-        for card in tarot.get("active_cards", []):
-            st.markdown(f"""
-                <div class="tarot-card">
-                    <div style="font-size: 0.8em; color: #ff00ff;">{card['suit']}</div>
-                    <b>{card['name']}</b>
-                </div>
-            """, unsafe_allow_html=True)
+    draw_tarot_spread()
     
     st.divider()
     st.subheader("Augean Flow")
@@ -126,7 +145,3 @@ with right:
 # --- Footer: The Djed Pillar ---
 st.divider()
 st.caption("Djed Pillar Status: STABLE | Wampum Treaties: 14 Signed | Signet: READY")
-
-# Auto-refresh logic
-time.sleep(5)
-st.rerun()
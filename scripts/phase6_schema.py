@@ -10,13 +10,33 @@ TASK_PIPELINE_STAGES = {"planner", "planner_executor", "executor_verifier"}
 
 
 def is_num(v: Any) -> bool:
-    return isinstance(v, (int, float)) and not isinstance(v, bool)
+    # bool is an int subclass and cannot itself be subclassed, so an identity check suffices.
+    return isinstance(v, (int, float)) and type(v) is not bool
 
 
 def is_str_list(v: Any) -> bool:
     return isinstance(v, list) and all(isinstance(x, str) and x.strip() for x in v)
 
 
+def _is_str(v: Any) -> bool:
+    return isinstance(v, str)
+
+
+def _is_nonblank_str(v: Any) -> bool:
+    return isinstance(v, str) and bool(v.strip())
+
+
+# (field, check) pairs validated in order after schema_version/generated_at/round.
+_TASK_CONTRACT_FIELDS = (
+    ("pattern", _is_str),
+    ("objective", _is_nonblank_str),
+    ("prompt_sha256", _is_str),
+    ("constraints", is_str_list),
+    ("deliverables", is_str_list),
+    ("verification", is_str_list),
+)
+
+
 def validate_task_contract_obj(obj: dict[str, Any], round_n: int) -> list[str]:
     errors: list[str] = []
     if int(obj.get("schema_version", -1)) != TASK_CONTRACT_SCHEMA_VERSION:
@@ -25,23 +45,16 @@ def validate_task_contract_obj(obj: dict[str, Any], round_n: int) -> list[str]:
         errors.append("task_contract.generated_at")
     if int(obj.get("round", -1)) != int(round_n):
         errors.append("task_contract.round")
-    if not isinstance(obj.get("pattern"), str):
-        errors.append("task_contract.pattern")
-    if not isinstance(obj.get("objective"), str) or not str(obj.get("objective")).strip():
-        errors.append("task_contract.objective")
-    if not isinstance(obj.get("prompt_sha256"), str):
-        errors.append("task_contract.prompt_sha256")
-    if not is_str_list(obj.get("constraints")):
-        errors.append("task_contract.constraints")
-    if not is_str_list(obj.get("deliverables")):
-        errors.append("task_contract.deliverables")
-    if not is_str_list(obj.get("verification")):
-        errors.append("task_contract.verification")
-    eh = obj.get("event_horizon")
+    get = obj.get
+    for key, check in _TASK_CONTRACT_FIELDS:
+        if not check(get(key)):
+            errors.append(f"task_contract.{key}")
+    eh = get("event_horizon")
     if not isinstance(eh, dict):
         errors.append("task_contract.event_horizon")
         return errors
-    if "mass" in eh and eh.get("mass") is not None and not is_num(eh.get("mass")):
+    mass = eh.get("mass")
+    if mass is not None and not is_num(mass):
         errors.append("task_contract.event_horizon.mass")
     if not isinstance(eh.get("split_required"), bool):
         errors.append("task_contract.event_horizon.split_required")
@@ -19,13 +19,27 @@ def normalize_text(text: str, token_limit: int = 4000):
         
     return text
 
+def normalize_file(path, token_limit: int = 4000):
+    """
+    normalize_text for a file, reading at most one char past the cut so a
+    multi-MB input is never loaded whole just to be amputated.
+    """
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        text = f.read(token_limit * 4 + 1)
+    return normalize_text(text, token_limit)
+
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("--text", required=True)
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("--text")
+    src.add_argument("--file")
     parser.add_argument("--limit", type=int, default=4000)
     args = parser.parse_args()
     
-    print(normalize_text(args.text, args.limit))
+    if args.file:
+        print(normalize_file(args.file, args.limit))
+    else:
+        print(normalize_text(args.text, args.limit))
 
 if __name__ == "__main__":
     main()
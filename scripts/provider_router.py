@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import threading
 import time
+import weakref
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Optional
@@ -26,46 +30,113 @@ class AttemptResult:
     text: str = ""
 
 
+# Breakers with deferred writes get them flushed at exit. A WeakSet, not one atexit
+# entry per instance, so discarded breakers can still be garbage collected.
+_LIVE_BREAKERS: "weakref.WeakSet[CircuitBreaker]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_breakers() -> None:
+    for breaker in list(_LIVE_BREAKERS):
+        breaker.flush()
+
+
 class CircuitBreaker:
     """
     Very small circuit-breaker persisted to <run>/state/providers.json.
     It is best-effort: it prevents repeated hammering of a provider that is failing.
+
+    State is kept in memory and only re-read when the file's mtime changes (other
+    agents share the file). Failures and circuit state changes are written at once;
+    plain "still healthy" successes are coalesced into one write FLUSH_DELAY_S later.
     """
 
+    FLUSH_DELAY_S = 0.5
+
     def __init__(self, state_path: Path, *, open_for_s: int = 120) -> None:
         self.state_path = state_path
         self.open_for_s = int(open_for_s)
+        self._cache: Optional[dict[str, Any]] = None
+        self._mtime_ns = 0
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._dirty: set[str] = set()
+        _LIVE_BREAKERS.add(self)
 
     def _load(self) -> dict[str, Any]:
-        try:
-            if not self.state_path.exists():
-                return {}
-            return json.loads(self.state_path.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-
-    def _save(self, st: dict[str, Any]) -> None:
-        try:
-            self.state_path.parent.mkdir(parents=True, exist_ok=True)
-            self.state_path.write_text(json.dumps(st, indent=2), encoding="utf-8")
-        except Exception:
-            pass
+        with self._lock:
+            if self._timer is not None:
+                return self._cache  # unflushed local changes are the freshest view
+            try:
+                mtime_ns = self.state_path.stat().st_mtime_ns
+            except OSError:
+                self._cache, self._mtime_ns = {}, 0
+                return self._cache
+            if self._cache is None or mtime_ns != self._mtime_ns:
+                try:
+                    st = json.loads(self.state_path.read_bytes())
+                except Exception:
+                    st = {}
+                self._cache = st if isinstance(st, dict) else {}
+                self._mtime_ns = mtime_ns
+            return self._cache
+
+    def _save(self, provider: str, row: dict[str, Any], *, defer: bool = False) -> None:
+        with self._lock:
+            self._cache[provider] = row
+            self._dirty.add(provider)
+            if defer:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.FLUSH_DELAY_S, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            st = self._cache
+            try:
+                # Another agent wrote since we loaded: merge our rows into its state.
+                if self.state_path.stat().st_mtime_ns != self._mtime_ns:
+                    disk = json.loads(self.state_path.read_bytes())
+                    if isinstance(disk, dict):
+                        disk.update({k: st[k] for k in self._dirty})
+                        st = self._cache = disk
+            except Exception:
+                pass
+            self._dirty.clear()
+            try:
+                self.state_path.parent.mkdir(parents=True, exist_ok=True)
+                # Temp file + rename so concurrent readers never see a half-written file.
+                tmp = self.state_path.with_name(f"{self.state_path.name}.{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(st, separators=(",", ":")), encoding="utf-8")
+                os.replace(tmp, self.state_path)
+                self._mtime_ns = self.state_path.stat().st_mtime_ns
+            except Exception:
+                pass
 
     def is_open(self, provider: str) -> bool:
         st = self._load()
-        row = (st.get(provider) or {}) if isinstance(st, dict) else {}
+        row = st.get(provider) or {}
         until = float(row.get("open_until") or 0)
         return until > time.time()
 
     def record_success(self, provider: str) -> None:
         st = self._load()
-        st[provider] = {"open_until": 0, "last_ok": time.time(), "last_err": ""}
-        self._save(st)
+        prev = st.get(provider) or {}
+        # Only the last_ok timestamp moves when the circuit was already closed.
+        healthy = not prev.get("open_until") and not prev.get("last_err") and provider in st
+        self._save(provider, {"open_until": 0, "last_ok": time.time(), "last_err": ""}, defer=healthy)
 
     def record_failure(self, provider: str, err: str) -> None:
         st = self._load()
-        st[provider] = {"open_until": time.time() + self.open_for_s, "last_ok": float((st.get(provider) or {}).get("last_ok") or 0), "last_err": (err or "")[:400]}
-        self._save(st)
+        self._save(provider, {"open_until": time.time() + self.open_for_s, "last_ok": float((st.get(provider) or {}).get("last_ok") or 0), "last_err": (err or "")[:400]})
 
 
 class ProviderRouter:
@@ -81,31 +152,34 @@ class ProviderRouter:
     def route(self, providers: list[ProviderSpec]) -> AttemptResult:
         last: Optional[AttemptResult] = None
         for spec in providers:
-            if self.budget_ok and not self.budget_ok(spec.name):
-                last = AttemptResult(ok=False, provider=spec.name, model=spec.model, duration_s=0.0, error="budget_exhausted")
+            name, model = spec.name, spec.model
+            if self.budget_ok and not self.budget_ok(name):
+                last = AttemptResult(ok=False, provider=name, model=model, duration_s=0.0, error="budget_exhausted")
                 continue
-            if self.circuit and self.circuit.is_open(spec.name):
-                last = AttemptResult(ok=False, provider=spec.name, model=spec.model, duration_s=0.0, error="circuit_open")
+            if self.circuit and self.circuit.is_open(name):
+                last = AttemptResult(ok=False, provider=name, model=model, duration_s=0.0, error="circuit_open")
                 continue
 
+            call = spec.call
             tries = max(0, int(spec.retries)) + 1
             for attempt in range(tries):
-                t0 = time.time()
+                # Monotonic clock: durations stay correct across wall-clock adjustments.
+                t0 = time.monotonic()
                 try:
-                    txt = spec.call()
-                    res = AttemptResult(ok=True, provider=spec.name, model=spec.model, duration_s=round(time.time() - t0, 3), text=txt or "")
+                    txt = call()
+                    res = AttemptResult(ok=True, provider=name, model=model, duration_s=time.monotonic() - t0, text=txt or "")
                     if self.circuit:
-                        self.circuit.record_success(spec.name)
+                        self.circuit.record_success(name)
                     return res
                 except Exception as e:
                     last = AttemptResult(
                         ok=False,
-                        provider=spec.name,
-                        model=spec.model,
-                        duration_s=round(time.time() - t0, 3),
+                        provider=name,
+                        model=model,
+                        duration_s=time.monotonic() - t0,
                         error=f"{type(e).__name__}: {e}",
                     )
                     if attempt >= tries - 1 and self.circuit:
-                        self.circuit.record_failure(spec.name, last.error)
+                        self.circuit.record_failure(name, last.error)
         return last or AttemptResult(ok=False, provider="", model="", duration_s=0.0, error="no_providers")
 
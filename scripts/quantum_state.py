@@ -11,14 +11,14 @@ except ImportError:
 
 # Add current dir to path for imports
 sys.path.append(os.path.dirname(__file__))
-from agent_runner_v2 import call_gemini_cloud_modern
+from agent_runner_v2 import call_gemini_cloud_modern_async
 
 async def spawn_branch(role: str, task: str, model: str):
     """Spawns a single parallel reality (agent thread)."""
     prompt = f"[QUANTUM BRANCH: {role}]\n{task}"
     try:
-        # Each branch runs independently in memory
-        result = await asyncio.to_thread(call_gemini_cloud_modern, prompt, model=model)
+        # Native async call: branches overlap on the event loop over one shared client.
+        result = await call_gemini_cloud_modern_async(prompt, model=model)
         return {"role": role, "result": result, "ok": True}
     except Exception as e:
         return {"role": role, "error": str(e), "ok": False}
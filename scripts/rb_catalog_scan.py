@@ -1,13 +1,36 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import datetime as dt
+import functools
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Set
-from urllib.parse import unquote, urljoin, urlparse
+from typing import Any, Dict, Iterable, List
+from urllib.parse import unquote, urlparse
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        # orjson rejects a UTF-8 BOM; stdlib json skips it on bytes input.
+        return orjson.loads(raw[3:] if raw.startswith(codecs.BOM_UTF8) else raw)
+    return json.loads(raw)
+
+
+def _dumps_indented(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
 
 
 REPO_ROOT = Path(os.environ.get("GEMINI_OP_REPO_ROOT", Path(__file__).resolve().parents[1]))
@@ -19,39 +42,50 @@ PROCESSED_DIR = REPO_ROOT / "ramshare" / "evidence" / "processed"
 POSTED_DIR = REPO_ROOT / "ramshare" / "evidence" / "posted"
 PACKETS_DIR = REPO_ROOT / "ramshare" / "evidence" / "upload_packets"
 DEFAULT_SHOP_URL = "https://www.redbubble.com/people/BrokenArrowMI/shop?asc=u"
+# Persistent Chromium profile: cookies/cache survive between scans. It holds the
+# Redbubble session, so it is git-ignored. Only one scan can hold it at a time.
+BROWSER_PROFILE_DIR = REPO_ROOT / "ramshare" / "state" / "playwright_rb_profile"
+# Titles only need the markup; images and fonts are never fetched.
+ITEM_LINK_SELECTOR = "a[href*='/i/']"
+BLOCKED_ASSETS = "**/*.{png,jpg,jpeg,gif,webp,avif,svg,ico,woff,woff2,ttf,otf}"
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_ITEM_SLUG = re.compile(r"/i/[^/]+/([^/?#]+)/\d+")
+# Item slug straight out of an href attribute's path, for scanning raw page HTML.
+_HREF_ITEM_SLUG = re.compile(r'href="[^"?#]*?/i/[^/"?#]+/([^/?#"]+)/\d+')
 
 
+# Shop scans see the same titles and slugs many times over (DOM nodes + raw HTML).
+@functools.lru_cache(maxsize=8192)
 def normalize_text(text: str) -> str:
-    return " ".join(re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).split())
+    return " ".join(_NON_ALNUM.sub(" ", (text or "").lower()).split())
 
 
+@functools.lru_cache(maxsize=8192)
 def title_case_from_slug(text: str) -> str:
-    tokens = [t for t in re.split(r"[^a-z0-9]+", (text or "").lower()) if len(t) >= 2]
+    tokens = [t for t in _NON_ALNUM.split((text or "").lower()) if len(t) >= 2]
     if not tokens:
         return ""
     return " ".join(t.capitalize() for t in tokens)
 
 
 def dedupe_keep_order(items: Iterable[str]) -> List[str]:
-    out: List[str] = []
-    seen: Set[str] = set()
+    # key -> first spelling seen; dicts keep insertion order. Whitespace is not
+    # alphanumeric, so the key can be taken from the raw item and the whitespace
+    # cleanup is only paid for items that are kept.
+    seen: Dict[str, str] = {}
     for item in items:
-        s = " ".join(str(item).split()).strip()
-        if not s:
-            continue
-        k = normalize_text(s)
-        if not k or k in seen:
-            continue
-        seen.add(k)
-        out.append(s)
-    return out
+        item = str(item)
+        k = normalize_text(item)
+        if k and k not in seen:
+            seen[k] = " ".join(item.split())
+    return list(seen.values())
 
 
 def load_json(path: Path, fallback: Dict[str, Any] | None = None) -> Dict[str, Any]:
-    if not path.exists():
-        return fallback or {}
     try:
-        return json.loads(path.read_text(encoding="utf-8-sig"))
+        # Parse the raw bytes: no intermediate str is built.
+        return _loads(path.read_bytes())
     except Exception:
         return fallback or {}
 
@@ -65,37 +99,37 @@ def infer_shop_url() -> str:
     return DEFAULT_SHOP_URL
 
 
+def _listing_title(path: Path) -> str:
+    obj = load_json(path, fallback={})
+    return str(obj.get("title") or "").strip()
+
+
+def _posted_title(path: Path) -> str:
+    rec = load_json(path, fallback={})
+    source_listing = Path(str(rec.get("source_listing_path") or "").strip())
+    if not source_listing.exists():
+        return ""
+    return _listing_title(source_listing)
+
+
 def collect_titles_from_local() -> List[str]:
-    titles: List[str] = []
-    for p in sorted(STAGING_DIR.glob("listing_*.json")):
-        obj = load_json(p, fallback={})
-        t = str(obj.get("title") or "").strip()
-        if t:
-            titles.append(t)
-    for p in sorted(PROCESSED_DIR.glob("listing_*.json")):
-        obj = load_json(p, fallback={})
-        t = str(obj.get("title") or "").strip()
-        if t:
-            titles.append(t)
-    for p in sorted(PACKETS_DIR.glob("**/upload_manifest.json")):
-        obj = load_json(p, fallback={})
-        t = str(obj.get("title") or "").strip()
-        if t:
-            titles.append(t)
-    for p in sorted(POSTED_DIR.glob("live_*.json")):
-        rec = load_json(p, fallback={})
-        source_listing = Path(str(rec.get("source_listing_path") or "").strip())
-        if source_listing.exists():
-            lst = load_json(source_listing, fallback={})
-            t = str(lst.get("title") or "").strip()
-            if t:
-                titles.append(t)
+    # Sorted so the first spelling kept by dedupe (and the catalog order) is stable
+    # across filesystems; the sort is negligible next to the file reads.
+    jobs = [(_listing_title, p) for p in sorted(STAGING_DIR.glob("listing_*.json"))]
+    jobs += [(_listing_title, p) for p in sorted(PROCESSED_DIR.glob("listing_*.json"))]
+    jobs += [(_listing_title, p) for p in sorted(PACKETS_DIR.glob("**/upload_manifest.json"))]
+    jobs += [(_posted_title, p) for p in sorted(POSTED_DIR.glob("live_*.json"))]
     seed = load_json(SEED_CATALOG_PATH, fallback={})
     seed_titles = seed.get("titles") if isinstance(seed.get("titles"), list) else []
-    for t in seed_titles:
-        if isinstance(t, str) and t.strip():
-            titles.append(t.strip())
-    return dedupe_keep_order(titles)
+    # File reads are I/O bound; map() keeps the directory order above. Blank titles
+    # normalize to an empty key, so dedupe drops them without a separate pass.
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        return dedupe_keep_order(
+            chain(
+                pool.map(lambda job: job[0](job[1]), jobs),
+                (t for t in seed_titles if isinstance(t, str)),
+            )
+        )
 
 
 def parse_redbubble_title_from_href(href: str) -> str:
@@ -105,15 +139,17 @@ def parse_redbubble_title_from_href(href: str) -> str:
         full = parsed.path or href
     except Exception:
         pass
-    m = re.search(r"/i/[^/]+/([^/?#]+)/\d+", full)
+    m = _ITEM_SLUG.search(full)
     if not m:
         return ""
     slug = unquote(m.group(1))
     return title_case_from_slug(slug)
 
 
-def scan_live_redbubble_titles(shop_url: str, max_items: int = 240) -> Dict[str, Any]:
+def scan_live_redbubble_titles(shop_url: str, max_items: int = 240, cdp_endpoint: str = "") -> Dict[str, Any]:
     try:
+        from playwright.sync_api import Error as PlaywrightError  # type: ignore
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError  # type: ignore
         from playwright.sync_api import sync_playwright  # type: ignore
     except Exception as e:
         return {"status": "error", "error": f"playwright_unavailable: {e}", "titles": []}
@@ -122,34 +158,64 @@ def scan_live_redbubble_titles(shop_url: str, max_items: int = 240) -> Dict[str,
     href_titles: List[str] = []
     blocked_reason = ""
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+        # Only what this scan created is closed; an attached browser keeps running.
+        own_browser = None
+        own_context = None
+        if cdp_endpoint:
+            # Attach to an already running (warm) browser instead of cold-starting one.
+            browser = p.chromium.connect_over_cdp(cdp_endpoint)
+            if browser.contexts:
+                context = browser.contexts[0]
+            else:
+                context = own_context = browser.new_context()
+        else:
+            BROWSER_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            try:
+                context = own_context = p.chromium.launch_persistent_context(str(BROWSER_PROFILE_DIR), headless=True)
+            except PlaywrightError:
+                # Profile locked by a concurrent scan: run this one in a throwaway browser.
+                own_browser = p.chromium.launch(headless=True)
+                context = own_context = own_browser.new_context()
+        page = context.new_page()
+        page.route(BLOCKED_ASSETS, lambda route: route.abort())
         try:
             page.goto(shop_url, wait_until="domcontentloaded", timeout=60000)
-            page.wait_for_timeout(5500)
+            # Return as soon as the first listing anchor renders instead of a fixed sleep.
+            try:
+                page.wait_for_selector(ITEM_LINK_SELECTOR, timeout=8000)
+            except PlaywrightTimeoutError:
+                pass
             title = (page.title() or "").strip()
             html = page.content()
             if "just a moment" in title.lower() or "security verification" in html.lower():
                 blocked_reason = "cloudflare_challenge"
-            link_nodes = page.query_selector_all("a[href*='/i/']")[:max_items]
-            for node in link_nodes:
-                href = str(node.get_attribute("href") or "").strip()
-                txt = str(node.inner_text() or "").strip()
+            # One round-trip for all anchors instead of two per node.
+            links = page.eval_on_selector_all(
+                ITEM_LINK_SELECTOR,
+                "(els, n) => els.slice(0, n).map(e => [e.getAttribute('href'), e.innerText])",
+                max_items,
+            )
+            for raw_href, raw_txt in links:
+                href = str(raw_href or "").strip()
+                txt = str(raw_txt or "").strip()
                 if txt and len(normalize_text(txt).split()) >= 2:
                     titles.append(txt)
                 if href:
-                    full = urljoin(shop_url, href)
-                    t = parse_redbubble_title_from_href(full)
+                    # Only the path is inspected, so relative hrefs need no urljoin.
+                    t = parse_redbubble_title_from_href(href)
                     if t:
                         href_titles.append(t)
-            for href in re.findall(r'href="([^"]+)"', html):
-                if "/i/" not in href:
-                    continue
-                t = parse_redbubble_title_from_href(urljoin(shop_url, href))
+            # One pass over the page; the slug is captured directly, no URL parsing.
+            for m in _HREF_ITEM_SLUG.finditer(html):
+                t = title_case_from_slug(unquote(m.group(1)))
                 if t:
                     href_titles.append(t)
         finally:
-            browser.close()
+            page.close()
+            if own_context is not None:
+                own_context.close()
+            if own_browser is not None:
+                own_browser.close()
     combined = dedupe_keep_order(titles + href_titles)
     if blocked_reason and not combined:
         return {"status": "blocked", "error": blocked_reason, "titles": []}
@@ -162,13 +228,18 @@ def main() -> int:
     ap.add_argument("--out", default=str(OUT_CATALOG_PATH))
     ap.add_argument("--max-items", type=int, default=240)
     ap.add_argument("--no-live", action="store_true")
+    ap.add_argument("--cdp-endpoint", default="", help="Attach to a running Chromium (e.g. http://localhost:9222) instead of launching one.")
     args = ap.parse_args()
 
     shop_url = str(args.shop_url).strip() or infer_shop_url()
     local_titles = collect_titles_from_local()
     live = {"status": "skipped", "error": "", "titles": []}
     if not bool(args.no_live):
-        live = scan_live_redbubble_titles(shop_url=shop_url, max_items=max(40, int(args.max_items)))
+        live = scan_live_redbubble_titles(
+            shop_url=shop_url,
+            max_items=max(40, int(args.max_items)),
+            cdp_endpoint=str(args.cdp_endpoint).strip(),
+        )
 
     merged = dedupe_keep_order(local_titles + list(live.get("titles") or []))
     payload: Dict[str, Any] = {
@@ -185,8 +256,8 @@ def main() -> int:
     }
     out = Path(args.out).resolve()
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-    print(json.dumps({"ok": True, "catalog_path": str(out), "total_count": len(merged), "live_scan": payload["live_scan"]}, indent=2))
+    out.write_text(_dumps_indented(payload), encoding="utf-8")
+    print(_dumps_indented({"ok": True, "catalog_path": str(out), "total_count": len(merged), "live_scan": payload["live_scan"]}))
     return 0
 
 
@@ -1,21 +1,57 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import hashlib
 import json
-import math
+import os
 import random
+import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        # orjson rejects a UTF-8 BOM; stdlib json skips it on bytes input.
+        return orjson.loads(raw[3:] if raw.startswith(codecs.BOM_UTF8) else raw)
+    return json.loads(raw)
+
+
+def _dumps_indented(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2)
+
+
+# Opt-in cache of rendered PNGs, keyed by the render seed. Bump the version whenever
+# a drawing change would make an old cached render differ from a fresh one.
+RENDER_CACHE_ENV = "GEMINI_OP_LINEART_CACHE_DIR"
+RENDER_CACHE_VERSION = 1
+
+INK = (0, 0, 0, 255)
+INK_SOFT = (0, 0, 0, 230)
+
+
 def stable_seed(*parts: str) -> int:
     base = "|".join(parts).encode("utf-8", errors="ignore")
-    digest = hashlib.sha256(base).hexdigest()
-    return int(digest[:16], 16)
+    # 64 bits is all the PRNG needs; blake2b emits exactly that without a hex round-trip.
+    return int.from_bytes(hashlib.blake2b(base, digest_size=8).digest(), "big")
 
 
 def random_point(rng: random.Random, width: int, height: int) -> tuple[int, int]:
@@ -34,7 +70,7 @@ def _int_range(raw: Any, default: Tuple[int, int], lo: int, hi: int) -> Tuple[in
 
 def load_style_profile(path: str) -> Dict[str, Any]:
     p = Path(path).resolve()
-    payload = json.loads(p.read_text(encoding="utf-8-sig"))
+    payload = _loads(p.read_bytes())
     if not isinstance(payload, dict):
         return {}
     return payload
@@ -55,67 +91,147 @@ def style_config(style_profile: Dict[str, Any]) -> Dict[str, Any]:
     return cfg
 
 
+# Briefs above this size are streamed so detailed outlines never exist as a full
+# tree of Python lists at once.
+STREAM_BRIEF_MIN_BYTES = 256 * 1024
+_GEO_COORDS_PREFIX = "geojson.coordinates"
+
+
+# What an open coordinates array holds so far: nothing yet, only numbers (a
+# position), only positions (a ring), or anything else.
+_EMPTY, _NUMBERS, _POSITIONS, _MIXED = range(4)
+
+
+def load_location_brief_streaming(path: str) -> Dict[str, Any]:
+    """Like load_location_brief, but geojson rings become (n, 2) arrays as soon as each one closes."""
+    builder = ijson.ObjectBuilder()
+    stack: List[List[Any]] = []
+    kinds: List[int] = []
+    coords: Any = None
+    has_coords = False
+    with open(path, "rb") as f:
+        # use_float: Decimal coordinates would be dropped as non-numeric by _ring_to_array.
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if not prefix.startswith(_GEO_COORDS_PREFIX) or (
+                len(prefix) > len(_GEO_COORDS_PREFIX) and prefix[len(_GEO_COORDS_PREFIX)] != "."
+            ):
+                builder.event(event, value)
+                continue
+            has_coords = True
+            if event == "start_array":
+                stack.append([])
+                kinds.append(_EMPTY)
+                continue
+            if event == "end_array":
+                value = stack.pop()
+                kind = kinds.pop()
+                if kind == _POSITIONS:
+                    value = _ring_to_array(value)
+                    kind = _MIXED
+                elif kind == _NUMBERS and len(value) >= 2:
+                    kind = _POSITIONS
+                else:
+                    kind = _MIXED
+            elif event in ("number", "boolean"):
+                kind = _NUMBERS
+            elif event in ("start_map", "map_key", "end_map"):
+                raise ValueError("unexpected object inside geojson.coordinates")
+            else:
+                kind = _MIXED
+            if stack:
+                stack[-1].append(value)
+                parent = kinds[-1]
+                if parent != kind:
+                    kinds[-1] = kind if parent == _EMPTY else _MIXED
+            else:
+                coords = value
+    payload = builder.value
+    if not isinstance(payload, dict):
+        return {}
+    if has_coords and isinstance(payload.get("geojson"), dict):
+        payload["geojson"]["coordinates"] = coords
+    return payload
+
+
 def load_location_brief(path: str) -> Dict[str, Any]:
     p = Path(path).resolve()
-    payload = json.loads(p.read_text(encoding="utf-8-sig"))
+    if ijson is not None and p.stat().st_size >= STREAM_BRIEF_MIN_BYTES:
+        try:
+            return load_location_brief_streaming(str(p))
+        except Exception:
+            pass  # Fall through so malformed input fails (or parses) exactly as before.
+    payload = _loads(p.read_bytes())
     if not isinstance(payload, dict):
         return {}
     return payload
 
 
-def _iter_geo_paths(geojson_obj: Dict[str, Any]) -> List[List[Tuple[float, float]]]:
+def _ring_to_array(path: Any) -> np.ndarray:
+    """(n, 2) float64 array of the numeric [x, y, ...] rows in path; malformed rows are skipped."""
+    if isinstance(path, np.ndarray):
+        return path  # Already converted while streaming the brief.
+    if not isinstance(path, list) or not path:
+        return np.empty((0, 2), dtype=np.float64)
+    try:
+        arr = np.asarray(path)
+    except ValueError:
+        arr = None
+    # Fast path: a well-formed numeric ring converts in one shot.
+    if arr is not None and arr.ndim == 2 and arr.shape[1] >= 2 and arr.dtype.kind in "biuf":
+        return arr[:, :2].astype(np.float64)
+    pts = [
+        (float(row[0]), float(row[1]))
+        for row in path
+        if isinstance(row, (list, tuple)) and len(row) >= 2 and isinstance(row[0], (int, float)) and isinstance(row[1], (int, float))
+    ]
+    return np.asarray(pts, dtype=np.float64).reshape(-1, 2)
+
+
+def _rings(coords: Any) -> List[Any]:
+    return coords if isinstance(coords, list) else []
+
+
+def _polygon_rings(coords: Any) -> List[Any]:
+    return [ring for poly in _rings(coords) if isinstance(poly, list) for ring in poly]
+
+
+_GEO_RINGS = {
+    "Polygon": _rings,
+    "MultiPolygon": _polygon_rings,
+    "LineString": lambda coords: [coords],
+    "MultiLineString": _rings,
+    "Point": lambda coords: [[coords] if isinstance(coords, list) else []],
+}
+
+
+def _iter_geo_paths(geojson_obj: Dict[str, Any]) -> List[np.ndarray]:
     gtype = str(geojson_obj.get("type") or "")
-    coords = geojson_obj.get("coordinates")
-    out: List[List[Tuple[float, float]]] = []
-
-    def to_pairs(path: Any) -> List[Tuple[float, float]]:
-        pts: List[Tuple[float, float]] = []
-        if isinstance(path, list):
-            for row in path:
-                if isinstance(row, list) and len(row) >= 2 and isinstance(row[0], (int, float)) and isinstance(row[1], (int, float)):
-                    pts.append((float(row[0]), float(row[1])))
-        return pts
-
-    if gtype == "Polygon" and isinstance(coords, list):
-        for ring in coords:
-            pts = to_pairs(ring)
-            if len(pts) >= 2:
-                out.append(pts)
-    elif gtype == "MultiPolygon" and isinstance(coords, list):
-        for poly in coords:
-            if isinstance(poly, list):
-                for ring in poly:
-                    pts = to_pairs(ring)
-                    if len(pts) >= 2:
-                        out.append(pts)
-    elif gtype == "LineString":
-        pts = to_pairs(coords)
-        if len(pts) >= 2:
-            out.append(pts)
-    elif gtype == "MultiLineString" and isinstance(coords, list):
-        for line in coords:
-            pts = to_pairs(line)
-            if len(pts) >= 2:
-                out.append(pts)
-    elif gtype == "Point":
-        pts = to_pairs([coords] if isinstance(coords, list) else [])
-        if pts:
-            out.append(pts)
+    rings_of = _GEO_RINGS.get(gtype)
+    if rings_of is None:
+        return []
+    min_points = 1 if gtype == "Point" else 2
+    out: List[np.ndarray] = []
+    for ring in rings_of(geojson_obj.get("coordinates")):
+        arr = _ring_to_array(ring)
+        if len(arr) >= min_points:
+            out.append(arr)
     return out
 
 
-def _decimate_path(path: List[Tuple[float, float]], max_points: int = 1200) -> List[Tuple[float, float]]:
-    if len(path) <= max_points:
-        return path
-    step = max(1, int(len(path) / max_points))
-    out = [path[i] for i in range(0, len(path), step)]
-    if out[-1] != path[-1]:
-        out.append(path[-1])
+def _decimate_path(path: np.ndarray, max_points: int = 1200) -> np.ndarray:
+    """Keep every step-th point (plus the last) as an (n, 2) array; a strided view, no per-point work."""
+    arr = np.asarray(path, dtype=np.float64).reshape(-1, 2)
+    if len(arr) <= max_points:
+        return arr
+    step = max(1, int(len(arr) / max_points))
+    out = arr[::step]
+    if not np.array_equal(out[-1], arr[-1]):
+        out = np.vstack((out, arr[-1:]))
     return out
 
 
 def _project_path(
-    path: List[Tuple[float, float]],
+    path: List[Tuple[float, float]] | np.ndarray,
     *,
     width: int,
     height: int,
@@ -123,13 +239,13 @@ def _project_path(
     pad_x: float,
     pad_y: float,
     scale: float,
-) -> List[Tuple[float, float]]:
+) -> np.ndarray:
+    """Project (lon, lat) points to pixel space; returns an (n, 2) float64 array."""
     min_x, _, min_y, _ = bbox
-    out: List[Tuple[float, float]] = []
-    for lon, lat in path:
-        px = pad_x + ((lon - min_x) * scale)
-        py = height - (pad_y + ((lat - min_y) * scale))
-        out.append((px, py))
+    arr = np.asarray(path, dtype=np.float64).reshape(-1, 2)
+    out = np.empty_like(arr)
+    out[:, 0] = pad_x + ((arr[:, 0] - min_x) * scale)
+    out[:, 1] = height - (pad_y + ((arr[:, 1] - min_y) * scale))
     return out
 
 
@@ -149,16 +265,9 @@ def draw_location_geometry(
     if not paths:
         return False
 
-    xs: List[float] = []
-    ys: List[float] = []
-    for p in paths:
-        for lon, lat in p:
-            xs.append(lon)
-            ys.append(lat)
-    if not xs or not ys:
-        return False
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
+    all_pts = np.concatenate(paths)
+    min_x, min_y = (float(v) for v in all_pts.min(axis=0))
+    max_x, max_y = (float(v) for v in all_pts.max(axis=0))
     span_x = max(1e-8, max_x - min_x)
     span_y = max(1e-8, max_y - min_y)
 
@@ -170,31 +279,36 @@ def draw_location_geometry(
     pad_x = (width - (span_x * scale)) / 2.0
     pad_y = (height - (span_y * scale)) / 2.0
 
-    drawn = 0
-    for p in paths:
-        q = _decimate_path(p, max_points=1400)
-        projected = _project_path(
-            q,
-            width=width,
-            height=height,
-            bbox=(min_x, max_x, min_y, max_y),
-            pad_x=pad_x,
-            pad_y=pad_y,
-            scale=scale,
-        )
-        if len(projected) <= 1:
-            continue
-        # Tiny deterministic jitter to keep hand-drawn feel while preserving geometry.
-        jitter_px = 1.2
-        stylized = [(x + rng.uniform(-jitter_px, jitter_px), y + rng.uniform(-jitter_px, jitter_px)) for x, y in projected]
-        draw.line(stylized, fill=(0, 0, 0, 255), width=stroke)
-        # Close polygons where needed.
-        if projected[0] != projected[-1] and len(projected) >= 3 and str(geojson_obj.get("type") or "") in {"Polygon", "MultiPolygon"}:
-            draw.line([stylized[-1], stylized[0]], fill=(0, 0, 0, 255), width=stroke)
-        drawn += 1
-
-    if drawn == 0:
+    # Decimate each ring, then project and jitter every kept point in one pass and
+    # split the result back into rings. Rings of 0-1 points are skipped before any
+    # rng draws, exactly as the per-ring loop did.
+    rings = [q for q in (_decimate_path(p, max_points=1400) for p in paths) if len(q) > 1]
+    if not rings:
         return False
+    projected = _project_path(
+        np.concatenate(rings),
+        width=width,
+        height=height,
+        bbox=(min_x, max_x, min_y, max_y),
+        pad_x=pad_x,
+        pad_y=pad_y,
+        scale=scale,
+    )
+    # Tiny deterministic jitter to keep hand-drawn feel while preserving geometry.
+    # Same rng draws in the same order (x then y per point, ring by ring) as
+    # rng.uniform(-j, j), so renders stay identical; only the arithmetic is vectorized.
+    jitter_px = 1.2
+    total = 2 * len(projected)
+    u = np.fromiter((rng.random() for _ in range(total)), dtype=np.float64, count=total).reshape(-1, 2)
+    stylized = projected + (-jitter_px + (2.0 * jitter_px) * u)
+    bounds = np.cumsum([len(q) for q in rings])[:-1]
+    close_rings = str(geojson_obj.get("type") or "") in {"Polygon", "MultiPolygon"}
+    for ring_proj, ring_sty in zip(np.split(projected, bounds), np.split(stylized, bounds)):
+        pts = ring_sty.ravel().tolist()
+        draw.line(pts, fill=INK, width=stroke)
+        # Close polygons where needed.
+        if close_rings and len(ring_proj) >= 3 and not np.array_equal(ring_proj[0], ring_proj[-1]):
+            draw.line([(pts[-2], pts[-1]), (pts[0], pts[1])], fill=INK, width=stroke)
 
     # Subtle map badge ring around geometry footprint for print-ready framing.
     ring_pad = int(min(width, height) * 0.1)
@@ -217,28 +331,38 @@ def draw_sigil_style(draw: ImageDraw.ImageDraw, width: int, height: int, rng: ra
     stroke_lo, stroke_hi = cfg.get("stroke_px_range", (2, 5))
     stroke = max(1, rng.randint(int(stroke_lo), int(stroke_hi)))
 
+    # Bound methods hoisted out of the per-primitive loops below.
+    ellipse = draw.ellipse
+    line = draw.line
     for i in range(ring_count):
         r = base_radius + (i * radius_step)
         box = (cx - r, cy - r, cx + r, cy + r)
-        draw.ellipse(box, outline=(0, 0, 0, 255), width=stroke)
+        ellipse(box, outline=INK, width=stroke)
 
     rays_lo, rays_hi = cfg.get("rays_range", (12, 20))
     rays = rng.randint(int(rays_lo), int(rays_hi))
     max_r = base_radius + ((ring_count - 1) * radius_step)
-    for i in range(rays):
-        angle = (360.0 / float(rays)) * i + rng.uniform(-3.0, 3.0)
-        rad = angle * 3.1415926535 / 180.0
-        x2 = int(cx + (max_r * 1.15) * math.cos(rad))
-        y2 = int(cy + (max_r * 1.15) * math.sin(rad))
-        draw.line([(cx, cy), (x2, y2)], fill=(0, 0, 0, 255), width=max(2, stroke - 1))
+    ray_width = max(2, stroke - 1)
+    # Jitter comes from the shared rng in the same order as before; the trig runs as
+    # one NumPy pass. The pi literal is kept as-is so ray endpoints don't move.
+    jitter = np.fromiter((rng.uniform(-3.0, 3.0) for _ in range(rays)), dtype=np.float64, count=rays)
+    rads = ((360.0 / float(rays)) * np.arange(rays) + jitter) * 3.1415926535 / 180.0
+    reach = max_r * 1.15
+    xs = (cx + reach * np.cos(rads)).astype(np.int64).tolist()
+    ys = (cy + reach * np.sin(rads)).astype(np.int64).tolist()
+    for x2, y2 in zip(xs, ys):
+        line([(cx, cy), (x2, y2)], fill=INK, width=ray_width)
 
     nodes_lo, nodes_hi = cfg.get("nodes_range", (18, 34))
     nodes = rng.randint(int(nodes_lo), int(nodes_hi))
+    spread = int(max_r * 1.1)
+    r_lo = max(2, stroke - 1)
+    randint = rng.randint
     for _ in range(nodes):
-        x = rng.randint(cx - int(max_r * 1.1), cx + int(max_r * 1.1))
-        y = rng.randint(cy - int(max_r * 1.1), cy + int(max_r * 1.1))
-        r = rng.randint(max(2, stroke - 1), stroke + 2)
-        draw.ellipse((x - r, y - r, x + r, y + r), fill=(0, 0, 0, 255))
+        x = randint(cx - spread, cx + spread)
+        y = randint(cy - spread, cy + spread)
+        r = randint(r_lo, stroke + 2)
+        ellipse((x - r, y - r, x + r, y + r), fill=INK)
 
 
 def draw_geometric_overlay(draw: ImageDraw.ImageDraw, width: int, height: int, rng: random.Random, cfg: Dict[str, Any]) -> None:
@@ -251,7 +375,7 @@ def draw_geometric_overlay(draw: ImageDraw.ImageDraw, width: int, height: int, r
     for _ in range(rng.randint(int(lines_lo), int(lines_hi))):
         p1 = random_point(rng, width, height)
         p2 = random_point(rng, width, height)
-        draw.line([p1, p2], fill=(0, 0, 0, 230), width=stroke)
+        draw.line([p1, p2], fill=INK_SOFT, width=stroke)
 
     # Arc fragments
     arcs_lo, arcs_hi = cfg.get("overlay_arcs_range", (8, 16))
@@ -262,37 +386,69 @@ def draw_geometric_overlay(draw: ImageDraw.ImageDraw, width: int, height: int, r
         box = (x - r, y - r, x + r, y + r)
         start = rng.uniform(0, 360)
         end = start + rng.uniform(35, 165)
-        draw.arc(box, start=start, end=end, fill=(0, 0, 0, 230), width=stroke)
+        draw.arc(box, start=start, end=end, fill=INK_SOFT, width=stroke)
 
 
-def render_lineart(
+def _location_sig(brief: Dict[str, Any]) -> str:
+    """Digest of the brief fields that shape a render; geometry is hashed as raw float64 bytes."""
+    h = hashlib.blake2b(digest_size=16)
+    for key in ("spot", "display_name", "geometry_type"):
+        h.update(str(brief.get(key) or "").encode("utf-8", errors="ignore") + b"\0")
+    geojson_obj = brief.get("geojson")
+    if isinstance(geojson_obj, dict):
+        h.update(str(geojson_obj.get("type") or "").encode("utf-8", errors="ignore") + b"\0")
+        for arr in _iter_geo_paths(geojson_obj):
+            h.update(len(arr).to_bytes(8, "big"))
+            h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+def _render_params(
     concept: str,
     prompt: str,
     style: str,
     width: int,
     height: int,
-    style_profile: Dict[str, Any] | None = None,
-    location_brief: Dict[str, Any] | None = None,
-) -> Image.Image:
+    style_profile: Dict[str, Any] | None,
+    location_brief: Dict[str, Any] | None,
+) -> Tuple[Dict[str, Any], str, Dict[str, Any], int]:
     profile = style_profile or {}
     brief = location_brief or {}
     cfg = style_config(profile)
     style_final = str(style or cfg.get("style") or "sigil").strip().lower()
     if style_final in ("map", "aerial", "landmark"):
         style_final = "landmark"
-    profile_sig = json.dumps(cfg, sort_keys=True)
-    location_sig = ""
-    if isinstance(brief, dict) and brief:
-        location_sig = json.dumps(
-            {
-                "spot": str(brief.get("spot") or ""),
-                "display_name": str(brief.get("display_name") or ""),
-                "geometry_type": str(brief.get("geometry_type") or ""),
-                "geojson": brief.get("geojson") if isinstance(brief.get("geojson"), dict) else {},
-            },
-            sort_keys=True,
-        )
+    # cfg only holds ints, strings and int tuples, so repr is already canonical.
+    profile_sig = repr(sorted(cfg.items()))
+    location_sig = _location_sig(brief) if isinstance(brief, dict) and brief else ""
     seed = stable_seed(concept, prompt, style_final, profile_sig, location_sig, str(width), str(height))
+    return cfg, style_final, brief, seed
+
+
+def render_cache_name(
+    concept: str,
+    prompt: str,
+    style: str,
+    width: int,
+    height: int,
+    style_profile: Dict[str, Any] | None = None,
+    location_brief: Dict[str, Any] | None = None,
+) -> str:
+    """File name a render is cached under; the seed covers every input that shapes the image."""
+    seed = _render_params(concept, prompt, style, width, height, style_profile, location_brief)[3]
+    return f"v{RENDER_CACHE_VERSION}_{seed:016x}_{width}x{height}.png"
+
+
+def render_lineart(
+    concept: str,
+    prompt: str,
+    style: str,
+    width: int,
+    height: int,
+    style_profile: Dict[str, Any] | None = None,
+    location_brief: Dict[str, Any] | None = None,
+) -> Image.Image:
+    cfg, style_final, brief, seed = _render_params(concept, prompt, style, width, height, style_profile, location_brief)
     rng = random.Random(seed)
     img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img, "RGBA")
@@ -332,6 +488,13 @@ def main() -> int:
     ap.add_argument("--meta-out", default="")
     ap.add_argument("--style-profile", default="")
     ap.add_argument("--location-brief-json", default="")
+    ap.add_argument(
+        "--compress-level",
+        type=int,
+        default=1,
+        choices=range(10),
+        help="zlib level for the PNG (1 = fast; mostly-empty line art compresses well anyway).",
+    )
     args = ap.parse_args()
 
     width = max(512, int(args.width))
@@ -352,7 +515,7 @@ def main() -> int:
         except Exception:
             location_brief = {}
 
-    img = render_lineart(
+    render_args = dict(
         concept=str(args.concept).strip(),
         prompt=str(args.prompt).strip(),
         style=str(args.style).strip().lower(),
@@ -361,7 +524,22 @@ def main() -> int:
         style_profile=style_profile,
         location_brief=location_brief,
     )
-    img.save(out_path, format="PNG")
+    cache_dir = os.environ.get(RENDER_CACHE_ENV, "").strip()
+    cached = Path(cache_dir) / render_cache_name(**render_args) if cache_dir else None
+    if cached is not None and cached.is_file():
+        # Identical inputs: skip drawing and PNG encoding entirely.
+        shutil.copyfile(cached, out_path)
+    else:
+        img = render_lineart(**render_args)
+        img.save(out_path, format="PNG", compress_level=int(args.compress_level), optimize=False)
+        if cached is not None:
+            try:
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+                shutil.copyfile(out_path, tmp)
+                os.replace(tmp, cached)
+            except OSError:
+                pass
 
     payload: Dict[str, str] = {
         "generated_at": datetime.now().isoformat(timespec="seconds"),
@@ -374,9 +552,9 @@ def main() -> int:
     if str(args.meta_out).strip():
         meta_path = Path(args.meta_out).resolve()
         meta_path.parent.mkdir(parents=True, exist_ok=True)
-        meta_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        meta_path.write_text(_dumps_indented(payload), encoding="utf-8")
 
-    print(json.dumps(payload, indent=2))
+    print(_dumps_indented(payload))
     return 0
 
 
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import heapq
 import json
 import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
@@ -54,37 +56,85 @@ def style_targets(profile: Dict[str, Any]) -> Dict[str, Tuple[float, float]]:
     }
 
 
-def source_edge_map(src_bgr: np.ndarray) -> np.ndarray:
-    gray = cv2.cvtColor(src_bgr, cv2.COLOR_BGR2GRAY)
+# Smoothed grays kept across search iterations, keyed by the knobs that shape them.
+# bilateralFilter dominates stylize_photo, and params repeat often enough to matter.
+SMOOTH_CACHE_SIZE = 16
+# Search candidates whose raw Canny density is below LO x the target minimum or above
+# HI x the target maximum are scored 0 without running the rest of the pipeline.
+FAST_REJECT_LO = 0.2
+FAST_REJECT_HI = 3.0
+# Shared structuring element for the per-candidate morphology (OpenCV never writes to it).
+KERNEL_3X3 = np.ones((3, 3), np.uint8)
+# The search scores a copy downscaled by s. Strokes keep their pixel width at any
+# scale (Canny edges and drawn lines are 1-4 px), so lengths shrink by s but widths
+# do not: stroke areas go with s, and area ratios measured on the copy run about 1/s
+# high until multiplied back by s.
+SEARCH_MAX_SIDE = 900
+# Params that are lengths, stroke areas or filter neighbourhoods, and the power of s
+# they follow on the search copy. Thickness knobs (stroke_width, dilate/erode/close
+# iterations) stay in pixels, which is what the s density correction assumes.
+SCALED_PARAMS = {
+    "hough_threshold": 1,
+    "hough_min_length": 1,
+    "hough_max_gap": 1,
+    "hough_len_floor": 1,
+    "contour_min_perim": 1,
+    "min_component_area": 1,
+    "bilateral_d": 1,
+    "gauss_ksize": 1,
+    "contour_block_size": 1,
+}
+# The copy loses fine detail (component counts, thin-stroke outlines), so it ranks
+# candidates well but not exactly: this many leaders are re-scored at full resolution
+# and the best of them wins. On 4500x5400 scenes the full-res winner was always in the
+# copy's top 8 (4th-6th), never reliably first.
+CONFIRM_TOP_K = 8
+# Components below this many pixels (at full resolution) count as specks.
+SMALL_COMPONENT_AREA = 22
+
+
+def source_edge_map(gray: np.ndarray) -> np.ndarray:
     blur = cv2.GaussianBlur(gray, (5, 5), 0)
     edges = cv2.Canny(blur, 80, 210, apertureSize=3, L2gradient=True)
     return edges
 
 
+def component_areas(mask: np.ndarray) -> Tuple[int, np.ndarray, np.ndarray]:
+    """(label count, label image, pixel area per label); label 0 is the background."""
+    # Only areas are ever used, so skip the bbox/centroid work of the WithStats variant.
+    n, labels = cv2.connectedComponents(mask, connectivity=8)
+    return n, labels, np.bincount(labels.ravel(), minlength=n)
+
+
 def apply_component_filter(mask: np.ndarray, min_area: int) -> np.ndarray:
-    n, labels, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+    n, labels, areas = component_areas(mask)
     if n <= 1:
         return mask
-    out = np.zeros_like(mask)
-    for i in range(1, n):
-        area = int(stats[i, cv2.CC_STAT_AREA])
-        if area >= min_area:
-            out[labels == i] = 255
-    return out
+    # One lookup per pixel instead of a full-image mask per component.
+    keep = areas >= min_area
+    keep[0] = False
+    lut = np.where(keep, np.uint8(255), np.uint8(0))
+    return lut[labels]
 
 
-def connected_component_stats(mask: np.ndarray) -> Tuple[int, float]:
-    n, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+def connected_component_stats(mask: np.ndarray, small_area: float = SMALL_COMPONENT_AREA) -> Tuple[int, float]:
+    n, _, areas = component_areas(mask)
     if n <= 1:
         return 0, 0.0
-    areas = stats[1:, cv2.CC_STAT_AREA]
+    areas = areas[1:]
     comp_count = int(len(areas))
-    small = int(np.count_nonzero(areas < 22))
+    small = int(np.count_nonzero(areas < small_area))
     small_ratio = float(small) / float(max(1, comp_count))
     return comp_count, small_ratio
 
 
-def contour_line_mask(gray: np.ndarray, p: Dict[str, int], stroke_width: int) -> np.ndarray:
+def contour_line_mask(
+    gray: np.ndarray,
+    p: Dict[str, int],
+    stroke_width: int,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Draws the contour strokes into out (a fresh mask when None) and returns it."""
     block = int(p.get("contour_block_size", 13))
     if block % 2 == 0:
         block += 1
@@ -100,23 +150,33 @@ def contour_line_mask(gray: np.ndarray, p: Dict[str, int], stroke_width: int) ->
     )
     th = cv2.medianBlur(th, 3)
     cnts, _ = cv2.findContours(th, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
-    out = np.zeros_like(gray)
+    if out is None:
+        out = np.zeros_like(gray)
     min_perim = float(int(p.get("contour_min_perim", 90)))
     eps_pct = float(int(p.get("contour_eps_pct", 2))) / 100.0
+    arc_length = cv2.arcLength
+    approx_poly = cv2.approxPolyDP
+    kept = []
     for cnt in cnts:
-        perim = float(cv2.arcLength(cnt, True))
+        perim = arc_length(cnt, True)
         if perim < min_perim:
             continue
-        eps = max(0.2, eps_pct * perim)
-        approx = cv2.approxPolyDP(cnt, eps, True)
-        if len(approx) < 2:
-            continue
-        cv2.polylines(out, [approx], isClosed=True, color=255, thickness=max(1, stroke_width - 1))
+        approx = approx_poly(cnt, max(0.2, eps_pct * perim), True)
+        if len(approx) >= 2:
+            kept.append(approx)
+    if kept:
+        # One rasterization call for every kept outline instead of one per contour.
+        cv2.polylines(out, kept, isClosed=True, color=255, thickness=max(1, stroke_width - 1))
     return out
 
 
-def hough_line_mask(edges: np.ndarray, p: Dict[str, int]) -> np.ndarray:
-    out = np.zeros_like(edges)
+def hough_line_mask(edges: np.ndarray, p: Dict[str, int], out: np.ndarray | None = None) -> np.ndarray:
+    """Draws the Hough segments into out (a fresh mask when None) and returns it.
+
+    out may be edges itself: the lines are detected before anything is drawn.
+    """
+    if out is None:
+        out = np.zeros_like(edges)
     lines = cv2.HoughLinesP(
         edges,
         rho=1,
@@ -130,67 +190,114 @@ def hough_line_mask(edges: np.ndarray, p: Dict[str, int]) -> np.ndarray:
     max_lines = int(p.get("hough_max_lines", 1400))
     len_floor = float(int(p.get("hough_len_floor", 20)))
     stroke = int(max(1, p.get("stroke_width", 1)))
-    kept: List[Tuple[float, Tuple[int, int, int, int]]] = []
-    for line in lines:
-        x1, y1, x2, y2 = line[0]
-        ln = float(np.hypot(float(x2 - x1), float(y2 - y1)))
-        if ln < len_floor:
-            continue
-        kept.append((ln, (x1, y1, x2, y2)))
-    kept.sort(key=lambda x: x[0], reverse=True)
-    for _, seg in kept[:max_lines]:
-        x1, y1, x2, y2 = seg
-        cv2.line(out, (x1, y1), (x2, y2), 255, stroke)
+    segs = lines.reshape(-1, 4)
+    lens = np.hypot((segs[:, 2] - segs[:, 0]).astype(np.float64), (segs[:, 3] - segs[:, 1]).astype(np.float64))
+    keep = lens >= len_floor
+    segs, lens = segs[keep], lens[keep]
+    # Longest first; the stable sort keeps detector order among equal lengths, so the
+    # max_lines cut picks the same segments as the old sorted(reverse=True).
+    segs = segs[np.argsort(-lens, kind="stable")[:max_lines]]
+    if len(segs):
+        # Each 2-point open polyline rasterizes exactly like cv2.line; one call draws all.
+        cv2.polylines(out, list(segs.reshape(-1, 2, 2).astype(np.int32)), isClosed=False, color=255, thickness=stroke)
     return out
 
 
-def stylize_photo(src_bgr: np.ndarray, p: Dict[str, int]) -> np.ndarray:
-    gray = cv2.cvtColor(src_bgr, cv2.COLOR_BGR2GRAY)
-    if int(p["bilateral_d"]) > 0:
-        gray = cv2.bilateralFilter(gray, int(p["bilateral_d"]), int(p["bilateral_sigma"]), int(p["bilateral_sigma"]))
-    if int(p["gauss_ksize"]) > 0:
-        k = int(p["gauss_ksize"])
-        if k % 2 == 0:
-            k += 1
-        gray = cv2.GaussianBlur(gray, (k, k), 0)
+def smoothed_gray(
+    gray: np.ndarray,
+    p: Dict[str, int],
+    cache: Dict[Tuple[int, int, int], np.ndarray] | None = None,
+) -> np.ndarray:
+    """Bilateral + Gaussian pre-filter; the result may be shared via cache, so treat it as read-only."""
+    d = max(0, int(p["bilateral_d"]))
+    sigma = int(p["bilateral_sigma"]) if d > 0 else 0
+    k = max(0, int(p["gauss_ksize"]))
+    if k > 0 and k % 2 == 0:
+        k += 1
+    key = (d, sigma, k)
+    if cache is not None and key in cache:
+        cache[key] = cache.pop(key)  # Move to the back: least recently used goes first.
+        return cache[key]
+    out = gray
+    if d > 0:
+        out = cv2.bilateralFilter(out, d, sigma, sigma)
+    if k > 0:
+        out = cv2.GaussianBlur(out, (k, k), 0)
+    if cache is not None:
+        cache[key] = out
+        if len(cache) > SMOOTH_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+    return out
+
+
+def fast_reject_window(targets: Dict[str, Tuple[float, float]], scale: float = 1.0) -> Tuple[float, float]:
+    """Raw Canny densities outside this loose band around the style target can't score well.
 
+    scale: the image the density is measured on, relative to full resolution.
+    """
+    edge_lo, edge_hi = targets["edge_density"]
+    return edge_lo * FAST_REJECT_LO / scale, edge_hi * FAST_REJECT_HI / scale
+
+
+def stylize_photo(
+    gray: np.ndarray,
+    p: Dict[str, int],
+    smooth_cache: Dict[Tuple[int, int, int], np.ndarray] | None = None,
+    reject_window: Tuple[float, float] | None = None,
+) -> np.ndarray | None:
+    """Line-art mask for p; None when reject_window is given and the raw edge density falls outside it."""
+    gray = smoothed_gray(gray, p, smooth_cache)
     edges = cv2.Canny(gray, int(p["canny_low"]), int(p["canny_high"]), apertureSize=3, L2gradient=True)
+    if reject_window is not None:
+        # Hopeless candidates skip Hough, contours and closing entirely.
+        density = cv2.countNonZero(edges) / float(edges.size)
+        if not (reject_window[0] <= density <= reject_window[1]):
+            return None
 
     if int(p["dilate_iter"]) > 0:
-        edges = cv2.dilate(edges, np.ones((3, 3), np.uint8), iterations=int(p["dilate_iter"]))
+        edges = cv2.dilate(edges, KERNEL_3X3, iterations=int(p["dilate_iter"]))
     if int(p["erode_iter"]) > 0:
-        edges = cv2.erode(edges, np.ones((3, 3), np.uint8), iterations=int(p["erode_iter"]))
+        edges = cv2.erode(edges, KERNEL_3X3, iterations=int(p["erode_iter"]))
 
     edges = apply_component_filter(edges, int(p["min_component_area"]))
 
     mode = int(p.get("line_mode", 1))
     mode = max(0, min(2, mode))
-    out = np.zeros_like(edges)
-    if mode in (0, 1):
-        out = cv2.bitwise_or(out, edges)
+    # Strokes are drawn at 255 straight into one accumulator, which equals OR-ing
+    # separate masks without allocating them. edges is fresh here and not read again
+    # once Hough has run, so modes that keep it use it as the accumulator.
+    out = edges if mode in (0, 1) else np.zeros_like(edges)
 
     if int(p["hough_enable"]) == 1 or mode in (1, 2):
-        out = cv2.bitwise_or(out, hough_line_mask(edges, p))
+        hough_line_mask(edges, p, out=out)
 
     if int(p.get("contour_enable", 0)) == 1:
-        out = cv2.bitwise_or(out, contour_line_mask(gray, p, int(max(1, p.get("stroke_width", 1)))))
+        contour_line_mask(gray, p, int(max(1, p.get("stroke_width", 1))), out=out)
 
     if int(p.get("close_iter", 0)) > 0:
         out = cv2.morphologyEx(
             out,
             cv2.MORPH_CLOSE,
-            np.ones((3, 3), np.uint8),
+            KERNEL_3X3,
             iterations=int(p.get("close_iter", 0)),
         )
     out = apply_component_filter(out, int(p["min_component_area"]))
     return out
 
 
-def edge_overlap_score(source_edges: np.ndarray, candidate_edges: np.ndarray) -> float:
-    a = (source_edges > 0).astype(np.uint8)
-    b = (candidate_edges > 0).astype(np.uint8)
-    inter = float(np.sum((a == 1) & (b == 1)))
-    union = float(np.sum((a == 1) | (b == 1)))
+def edge_overlap_score(
+    source_edges: np.ndarray,
+    candidate_edges: np.ndarray,
+    source_count: int | None = None,
+) -> float:
+    """IoU of two 0/255 masks; source_count is countNonZero(source_edges) when already known."""
+    # Both masks are 0/255 uint8 (Canny / component filter output), so the bitwise
+    # ops match the old boolean logic without building 0/1 copies.
+    inter = float(cv2.countNonZero(cv2.bitwise_and(source_edges, candidate_edges)))
+    if source_count is None:
+        source_count = cv2.countNonZero(source_edges)
+    # |A or B| = |A| + |B| - |A and B|: two counts instead of a second full-image op.
+    union = float(source_count + cv2.countNonZero(candidate_edges)) - inter
     if union <= 0.0:
         return 0.0
     return inter / union
@@ -204,13 +311,15 @@ def metric_distance(value: float, lo: float, hi: float) -> float:
     return (value - hi) / max(1e-6, hi)
 
 
-def candidate_metrics(alpha: np.ndarray) -> Dict[str, float]:
-    area = float(alpha.shape[0] * alpha.shape[1]) or 1.0
+def candidate_metrics(alpha: np.ndarray, scale: float = 1.0) -> Dict[str, float]:
+    """Metrics as they would read at full resolution; scale is alpha's size relative to it."""
+    # Area ratios of fixed-width strokes are ~1/scale too high on a downscaled mask.
+    area = (float(alpha.shape[0] * alpha.shape[1]) or 1.0) / scale
     alpha_ratio = float(np.count_nonzero(alpha)) / area
     # Approx edge density from alpha edges.
     edges = cv2.Canny(alpha, 60, 180, apertureSize=3, L2gradient=True)
     edge_density = float(np.count_nonzero(edges)) / area
-    comp_count, small_ratio = connected_component_stats(alpha)
+    comp_count, small_ratio = connected_component_stats(alpha, SMALL_COMPONENT_AREA * scale)
     return {
         "alpha_ratio": alpha_ratio,
         "edge_density": edge_density,
@@ -225,9 +334,11 @@ def score_candidate(
     candidate_alpha: np.ndarray,
     targets: Dict[str, Tuple[float, float]],
     fill_ratio: float,
+    source_count: int | None = None,
+    scale: float = 1.0,
 ) -> Dict[str, float]:
-    overlap = edge_overlap_score(source_edges, candidate_alpha)
-    m = candidate_metrics(candidate_alpha)
+    overlap = edge_overlap_score(source_edges, candidate_alpha, source_count)
+    m = candidate_metrics(candidate_alpha, scale)
     edge_lo, edge_hi = targets["edge_density"]
     alpha_lo, alpha_hi = targets["alpha_ratio"]
     edge_penalty = metric_distance(m["edge_density"], edge_lo, edge_hi)
@@ -255,9 +366,34 @@ def score_candidate(
     }
 
 
-def place_on_canvas(alpha: np.ndarray, width: int, height: int, fill_ratio: float, stroke_boost: int) -> Image.Image:
+SCORE_KEYS = (
+    "total_score",
+    "fidelity_score",
+    "style_score",
+    "simplicity_score",
+    "fill_score",
+    "alpha_ratio",
+    "edge_density",
+    "component_count",
+    "small_component_ratio",
+)
+
+
+def place_on_canvas(
+    alpha: np.ndarray,
+    width: int,
+    height: int,
+    fill_ratio: float,
+    stroke_boost: int,
+    filtered_min_area: int = 0,
+) -> Image.Image:
+    """filtered_min_area: alpha already went through apply_component_filter at this area."""
     h, w = alpha.shape[:2]
-    alpha = apply_component_filter(alpha, max(22, int((h * w) * 0.000006)))
+    min_area = max(22, int((h * w) * 0.000006))
+    # Every component of an already-filtered mask is at least filtered_min_area, so a
+    # pass at a smaller or equal threshold would keep everything.
+    if filtered_min_area < min_area:
+        alpha = apply_component_filter(alpha, min_area)
     row_counts = np.count_nonzero(alpha > 0, axis=1)
     strong_thresh = max(10, int(0.004 * w))
     strong_rows = np.where(row_counts >= strong_thresh)[0]
@@ -290,14 +426,22 @@ def place_on_canvas(alpha: np.ndarray, width: int, height: int, fill_ratio: floa
     canvas = np.zeros((height, width, 4), dtype=np.uint8)
     x0 = (width - out_w) // 2
     y0 = (height - out_h) // 2
+    # Black strokes: RGB is already zero, so only the alpha plane is written.
     canvas[y0 : y0 + out_h, x0 : x0 + out_w, 3] = resized_alpha
-    # Black strokes.
-    canvas[y0 : y0 + out_h, x0 : x0 + out_w, 0] = 0
-    canvas[y0 : y0 + out_h, x0 : x0 + out_w, 1] = 0
-    canvas[y0 : y0 + out_h, x0 : x0 + out_w, 2] = 0
     return Image.fromarray(canvas)
 
 
+def scale_params(p: Dict[str, int], s: float) -> Dict[str, int]:
+    """Params as they apply to an image resized by s (see SCALED_PARAMS); 0 stays 0 (off)."""
+    if s == 1.0:
+        return p
+    out = dict(p)
+    for name, power in SCALED_PARAMS.items():
+        if int(out.get(name, 0)) > 0:
+            out[name] = max(1, int(round(int(out[name]) * (s**power))))
+    return out
+
+
 def random_params(rng: random.Random, base: Dict[str, int] | None = None, local: bool = False) -> Dict[str, int]:
     b = base or {}
     jitter = 8 if local else 28
@@ -344,6 +488,62 @@ def random_params(rng: random.Random, base: Dict[str, int] | None = None, local:
     }
 
 
+# Search inputs for pool workers, installed once per process by the initializer.
+_WORKER_SEARCH: Dict[str, Any] = {}
+
+
+def _set_search_inputs(
+    gray: np.ndarray,
+    source_edges: np.ndarray,
+    targets: Dict[str, Tuple[float, float]],
+    scale: float,
+) -> None:
+    global _WORKER_SEARCH
+    _WORKER_SEARCH = {
+        "gray": gray,
+        "source_edges": source_edges,
+        # Constant for the whole search; counted once instead of per candidate.
+        "source_count": cv2.countNonZero(source_edges),
+        "targets": targets,
+        "scale": scale,
+        "smooth_cache": {},
+    }
+
+
+def _evaluate_params(params: Dict[str, int]) -> Dict[str, float]:
+    w = _WORKER_SEARCH
+    alpha = stylize_photo(
+        w["gray"],
+        scale_params(params, w["scale"]),
+        w["smooth_cache"],
+        reject_window=fast_reject_window(w["targets"], w["scale"]),
+    )
+    if alpha is None:
+        return dict.fromkeys(SCORE_KEYS, 0.0)
+    return score_candidate(
+        source_edges=w["source_edges"],
+        candidate_alpha=alpha,
+        targets=w["targets"],
+        fill_ratio=float(params["fill_ratio"]) / 100.0,
+        source_count=w["source_count"],
+        scale=w["scale"],
+    )
+
+
+def _score_params(params_list: List[Dict[str, int]], inputs: Tuple[Any, ...]) -> List[Dict[str, float]]:
+    """Scores params_list on inputs (see _set_search_inputs), across processes when there are CPUs to spare."""
+    _set_search_inputs(*inputs)
+    workers = min(len(params_list), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_set_search_inputs, initargs=inputs) as pool:
+            return list(pool.map(_evaluate_params, params_list))
+    return [_evaluate_params(params) for params in params_list]
+
+
+def params_key(params: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(sorted(params.items()))
+
+
 def run_search(
     *,
     src_path: Path,
@@ -354,6 +554,8 @@ def run_search(
     height: int,
     cycles: int,
     seed: int,
+    search_max_side: int = SEARCH_MAX_SIDE,
+    compress_level: int = 1,
 ) -> Dict[str, Any]:
     profile = load_style_profile(style_profile_path)
     targets = style_targets(profile)
@@ -362,7 +564,16 @@ def run_search(
     src_bgr = cv2.imread(str(src_path), cv2.IMREAD_COLOR)
     if src_bgr is None:
         raise SystemExit(f"Unable to read image: {src_path}")
-    source_edges = source_edge_map(src_bgr)
+    # Every candidate starts from the same gray; convert once instead of per try.
+    gray = cv2.cvtColor(src_bgr, cv2.COLOR_BGR2GRAY)
+    del src_bgr
+    search_scale = 1.0
+    search_gray = gray
+    if search_max_side > 0 and max(gray.shape[:2]) > search_max_side:
+        search_scale = search_max_side / float(max(gray.shape[:2]))
+        search_gray = cv2.resize(gray, None, fx=search_scale, fy=search_scale, interpolation=cv2.INTER_AREA)
+    source_edges = source_edge_map(search_gray)
+    search_inputs = (search_gray, source_edges, targets, search_scale)
 
     best: Dict[str, Any] = {}
     rows: List[Dict[str, Any]] = []
@@ -370,15 +581,27 @@ def run_search(
     global_tries = max(8, cycles * 5)
     local_tries = max(10, cycles * 6)
 
-    for i in range(global_tries):
-        params = random_params(rng)
-        alpha = stylize_photo(src_bgr, params)
-        score = score_candidate(
-            source_edges=source_edges,
-            candidate_alpha=alpha,
-            targets=targets,
-            fill_ratio=float(params["fill_ratio"]) / 100.0,
-        )
+    # Global tries don't depend on each other: draw every param set up front (same rng
+    # order as drawing them one by one) and score them across processes.
+    # Scoring is deterministic in params, so repeated draws reuse the first result.
+    score_cache: Dict[Tuple[Tuple[str, Any], ...], Dict[str, Any]] = {}
+    score_cache_size = max(1, cycles * 20)
+
+    def remember(key: Tuple[Tuple[str, Any], ...], score: Dict[str, Any]) -> None:
+        score_cache[key] = score
+        while len(score_cache) > score_cache_size:
+            score_cache.pop(next(iter(score_cache)))
+
+    global_params = [random_params(rng) for _ in range(global_tries)]
+    global_keys = [params_key(params) for params in global_params]
+    pending = {}
+    for key, params in zip(global_keys, global_params):
+        pending.setdefault(key, params)
+    fresh = dict(zip(pending, _score_params(list(pending.values()), search_inputs)))
+    global_scores = [fresh[key] for key in global_keys]
+    for key, score in fresh.items():
+        remember(key, score)
+    for i, (params, score) in enumerate(zip(global_params, global_scores)):
         row = {
             "iter": i + 1,
             "phase": "global",
@@ -391,14 +614,13 @@ def run_search(
 
     base_params = dict(best.get("params") or {})
     for i in range(local_tries):
+        # Each local try jitters around the best so far, so this phase stays serial.
         params = random_params(rng, base=base_params, local=True)
-        alpha = stylize_photo(src_bgr, params)
-        score = score_candidate(
-            source_edges=source_edges,
-            candidate_alpha=alpha,
-            targets=targets,
-            fill_ratio=float(params["fill_ratio"]) / 100.0,
-        )
+        key = params_key(params)
+        score = score_cache.get(key)
+        if score is None:
+            score = _evaluate_params(params)
+            remember(key, score)
         row = {
             "iter": i + 1,
             "phase": "local",
@@ -410,20 +632,39 @@ def run_search(
             best = row
             base_params = dict(params)
 
-    best_alpha = stylize_photo(src_bgr, best["params"])
+    confirmed: List[Dict[str, Any]] = []
+    if search_scale != 1.0:
+        leaders: Dict[Tuple[Tuple[str, Any], ...], Dict[str, Any]] = {}
+        for row in sorted(rows, key=lambda r: float(r["total_score"]), reverse=True):
+            leaders.setdefault(params_key(row["params"]), row)
+            if len(leaders) == CONFIRM_TOP_K:
+                break
+        full_inputs = (gray, source_edge_map(gray), targets, 1.0)
+        full_scores = _score_params([row["params"] for row in leaders.values()], full_inputs)
+        best = {}
+        for row, score in zip(leaders.values(), full_scores):
+            confirmed.append({**row, **score, "search_total_score": row["total_score"]})
+            if not best or float(score["total_score"]) > float(best["total_score"]):
+                best = confirmed[-1]
+
+    # The worker inputs are full resolution by now (no downscale, or the confirm pass),
+    # so the winner's smoothed gray is usually cached already.
+    best_alpha = stylize_photo(gray, best["params"], _WORKER_SEARCH["smooth_cache"])
     img = place_on_canvas(
         best_alpha,
         width=width,
         height=height,
         fill_ratio=float(best["params"]["fill_ratio"]) / 100.0,
         stroke_boost=max(1, int(best["params"].get("stroke_width", 1))),
+        filtered_min_area=int(best["params"]["min_component_area"]),
     )
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(out_path, format="PNG")
+    img.save(out_path, format="PNG", compress_level=compress_level, optimize=False)
     preview_path = out_path.with_name(f"{out_path.stem}_preview.png")
-    preview = Image.new("RGBA", img.size, (255, 255, 255, 255))
-    preview.alpha_composite(img)
-    preview.convert("RGB").save(preview_path, format="PNG")
+    # Black strokes with a 0/255 alpha over white: the preview is just the inverted alpha.
+    ink = Image.fromarray(255 - np.asarray(img)[:, :, 3])
+    preview = Image.merge("RGB", (ink, ink, ink))
+    preview.save(preview_path, format="PNG", compress_level=compress_level, optimize=False)
 
     report = {
         "generated_at": dt.datetime.now().isoformat(timespec="seconds"),
@@ -434,9 +675,14 @@ def run_search(
         "canvas": {"width": width, "height": height, "transparent": True},
         "cycles": cycles,
         "seed": seed,
+        "search_scale": search_scale,
         "best": best,
+        "confirmed": [
+            {k: row[k] for k in ("phase", "iter", "search_total_score", "total_score")} for row in confirmed
+        ],
         "targets": targets,
-        "top_candidates": sorted(rows, key=lambda r: float(r["total_score"]), reverse=True)[:12],
+        # Same order as a stable descending sort, ties included, without sorting every row.
+        "top_candidates": heapq.nlargest(12, rows, key=lambda r: float(r["total_score"])),
         "try_count": len(rows),
     }
     report_path.parent.mkdir(parents=True, exist_ok=True)
@@ -454,6 +700,19 @@ def main() -> int:
     ap.add_argument("--height", type=int, default=5400)
     ap.add_argument("--cycles", type=int, default=12)
     ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument(
+        "--search-max-side",
+        type=int,
+        default=SEARCH_MAX_SIDE,
+        help="Longest side of the image the param search runs on (0 = search at full resolution).",
+    )
+    ap.add_argument(
+        "--compress-level",
+        type=int,
+        default=1,
+        choices=range(10),
+        help="zlib level for the output PNGs (1 = fast; the sparse line art compresses well anyway).",
+    )
     args = ap.parse_args()
 
     src_path = Path(args.image).resolve()
@@ -470,6 +729,8 @@ def main() -> int:
         height=max(512, int(args.height)),
         cycles=max(1, int(args.cycles)),
         seed=int(args.seed),
+        search_max_side=max(0, int(args.search_max_side)),
+        compress_level=int(args.compress_level),
     )
     print(
         json.dumps(
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import argparse
+import math
 from pathlib import Path
 from typing import Tuple
 
 from PIL import Image
 
 
+# Lanczos kernel radius in source pixels (Pillow's LANCZOS is a = 3).
+LANCZOS_SUPPORT = 3
+
+
 def nontransparent_bbox(img: Image.Image) -> Tuple[int, int, int, int] | None:
-    rgba = img.convert("RGBA")
-    alpha = rgba.split()[-1]
-    return alpha.getbbox()
+    # Already-RGBA input (stickerize converts once) needs no second full-image copy,
+    # and getchannel pulls just the alpha band instead of splitting all four.
+    rgba = img if img.mode == "RGBA" else img.convert("RGBA")
+    return rgba.getchannel("A").getbbox()
 
 
 def stickerize(input_path: Path, output_path: Path, canvas_px: int = 5000, padding_pct: float = 0.08) -> None:
@@ -30,7 +36,19 @@ def stickerize(input_path: Path, output_path: Path, canvas_px: int = 5000, paddi
         square = Image.new("RGBA", (side, side), (0, 0, 0, 0))
         offset = ((side - cropped.width) // 2, (side - cropped.height) // 2)
         square.alpha_composite(cropped, dest=offset)
-        final = square.resize((canvas_px, canvas_px), Image.Resampling.LANCZOS)
+        # Only resample the part of the canvas the artwork (plus the Lanczos kernel's
+        # reach) can touch; the rest of the upscaled padding is transparent anyway.
+        k = canvas_px / side
+        # The kernel spans LANCZOS_SUPPORT output pixels when upscaling but
+        # LANCZOS_SUPPORT / k source pixels when downscaling (k < 1).
+        reach = math.ceil(LANCZOS_SUPPORT * max(1.0, 1.0 / k)) + 1
+        x0 = max(0, math.floor((offset[0] - reach) * k))
+        y0 = max(0, math.floor((offset[1] - reach) * k))
+        x1 = min(canvas_px, math.ceil((offset[0] + cropped.width + reach) * k))
+        y1 = min(canvas_px, math.ceil((offset[1] + cropped.height + reach) * k))
+        part = square.resize((x1 - x0, y1 - y0), Image.Resampling.LANCZOS, box=(x0 / k, y0 / k, x1 / k, y1 / k))
+        final = Image.new("RGBA", (canvas_px, canvas_px), (0, 0, 0, 0))
+        final.paste(part, (x0, y0))
         output_path.parent.mkdir(parents=True, exist_ok=True)
         final.save(output_path, format="PNG")
 
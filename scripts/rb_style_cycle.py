@@ -7,6 +7,7 @@ import random
 import shutil
 import subprocess
 import sys
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Sequence, Tuple
@@ -246,6 +247,31 @@ def call_lineart_generator(
         raise RuntimeError(f"lineart generation failed: {out}")
 
 
+def _sample_theme(
+    *,
+    theme: str,
+    image_path: Path,
+    profile_path: Path,
+    style: str,
+    width: int,
+    height: int,
+) -> Dict[str, Any]:
+    prompt = (
+        f"Minimal black-and-white linework representation of {theme}; "
+        "transparent background, clean strokes, print-ready composition."
+    )
+    call_lineart_generator(
+        concept=theme,
+        prompt=prompt,
+        out_path=image_path,
+        profile_path=profile_path,
+        style=style,
+        width=width,
+        height=height,
+    )
+    return analyze_style_image(image_path)
+
+
 def evaluate_overrides(
     *,
     base_profile: Dict[str, Any],
@@ -255,31 +281,31 @@ def evaluate_overrides(
     width: int,
     height: int,
     work_dir: Path,
+    pool: Executor | None = None,
 ) -> Dict[str, Any]:
+    """pool: when given, theme samples are rendered on it concurrently (rows keep theme order)."""
     work_dir.mkdir(parents=True, exist_ok=True)
     temp_profile = dict(base_profile)
     temp_profile["generator_overrides"] = sanitize_overrides(overrides)
     temp_profile_path = work_dir / "candidate_profile.json"
     temp_profile_path.write_text(json.dumps(temp_profile, indent=2), encoding="utf-8")
 
-    rows: List[Dict[str, Any]] = []
-    for idx, theme in enumerate(themes):
-        image_path = work_dir / f"sample_{idx:02d}.png"
-        prompt = (
-            f"Minimal black-and-white linework representation of {theme}; "
-            "transparent background, clean strokes, print-ready composition."
-        )
-        call_lineart_generator(
-            concept=theme,
-            prompt=prompt,
-            out_path=image_path,
+    jobs = [
+        dict(
+            theme=theme,
+            image_path=work_dir / f"sample_{idx:02d}.png",
             profile_path=temp_profile_path,
             style=str(overrides.get("style") or "sigil"),
             width=width,
             height=height,
         )
-        row = analyze_style_image(image_path)
-        rows.append(row)
+        for idx, theme in enumerate(themes)
+    ]
+    if pool is None:
+        rows = [_sample_theme(**job) for job in jobs]
+    else:
+        futures = [pool.submit(_sample_theme, **job) for job in jobs]
+        rows = [f.result() for f in futures]
 
     summary = summarize_metrics(rows)
     distance = style_distance(ref_summary, summary)
@@ -333,6 +359,12 @@ def main() -> int:
     ap.add_argument("--height", type=int, default=1800)
     ap.add_argument("--seed", type=int, default=20260219)
     ap.add_argument("--apply", action="store_true", help="Write best overrides back into style profile.")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) // 2),
+        help="Line-art samples rendered at once (each is its own generator subprocess).",
+    )
     args = ap.parse_args()
 
     rng = random.Random(int(args.seed))
@@ -363,6 +395,9 @@ def main() -> int:
     run_dir.mkdir(parents=True, exist_ok=True)
 
     base_overrides = sanitize_overrides(profile.get("generator_overrides") if isinstance(profile.get("generator_overrides"), dict) else {})
+    # Samples are independent generator subprocesses; one shared pool caps how many run at once.
+    jobs = max(1, int(args.jobs))
+    pool = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
     best = evaluate_overrides(
         base_profile=profile,
         overrides=base_overrides,
@@ -371,6 +406,7 @@ def main() -> int:
         width=int(args.width),
         height=int(args.height),
         work_dir=run_dir / "base",
+        pool=pool,
     )
     history: List[Dict[str, Any]] = [{"cycle": 0, "best": best}]
     global_best = dict(best)
@@ -382,9 +418,8 @@ def main() -> int:
         for _ in range(max(1, int(args.candidates_per_cycle) - 1)):
             candidates.append(mutate_overrides(candidates[0], rng=rng, scale=scale))
 
-        best_cycle = None
-        for idx, cand in enumerate(candidates):
-            eval_row = evaluate_overrides(
+        def eval_candidate(idx: int, cand: Dict[str, Any]) -> Dict[str, Any]:
+            return evaluate_overrides(
                 base_profile=profile,
                 overrides=cand,
                 ref_summary=ref_summary,
@@ -392,7 +427,18 @@ def main() -> int:
                 width=int(args.width),
                 height=int(args.height),
                 work_dir=run_dir / f"cycle_{cycle_idx:02d}" / f"cand_{idx:02d}",
+                pool=pool,
             )
+
+        if pool is None:
+            eval_rows = [eval_candidate(idx, cand) for idx, cand in enumerate(candidates)]
+        else:
+            # Candidate threads only wait on their samples, so all of them can feed the pool.
+            with ThreadPoolExecutor(max_workers=len(candidates)) as cand_pool:
+                eval_rows = list(cand_pool.map(eval_candidate, range(len(candidates)), candidates))
+
+        best_cycle = None
+        for idx, eval_row in enumerate(eval_rows):
             eval_row["candidate_index"] = idx
             cycle_rows.append(eval_row)
             if best_cycle is None or float(eval_row["score"]) > float(best_cycle["score"]):
@@ -411,6 +457,9 @@ def main() -> int:
             }
         )
 
+    if pool is not None:
+        pool.shutdown()
+
     report = {
         "generated_at": datetime.now().isoformat(timespec="seconds"),
         "style_profile_path": str(style_profile_path),
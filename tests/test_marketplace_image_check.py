@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import json
 import os
 import subprocess
@@ -15,6 +16,15 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 SCRIPT = REPO_ROOT / "scripts" / "marketplace_image_check.py"
 
 
+def load_module(path: Path):
+    spec = importlib.util.spec_from_file_location(path.stem, str(path))
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"unable to load module from {path}")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
 def make_test_png(path: Path, w: int, h: int) -> None:
     img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
@@ -81,6 +91,30 @@ class MarketplaceImageCheckTests(unittest.TestCase):
             payload = json.loads(out.read_text(encoding="utf-8"))
             self.assertEqual(payload["results"][0]["status"], "fail")
 
+    def test_header_probe_matches_pillow(self) -> None:
+        mod = load_module(SCRIPT)
+        with tempfile.TemporaryDirectory(prefix="gemop_marketcheck_probe_") as td:
+            root = Path(td).resolve()
+            samples = [
+                ("png", "RGBA", root / "rgba.png"),
+                ("png", "P", root / "palette.png"),
+                ("jpeg", "RGB", root / "photo.jpg"),
+                ("jpeg", "CMYK", root / "print.jpg"),
+                ("webp", "RGB", root / "lossy.webp"),
+                ("webp", "RGBA", root / "alpha.webp"),
+                ("jpeg", "L", root / "misnamed.png"),
+            ]
+            for fmt, mode, path in samples:
+                Image.new(mode, (321, 123)).save(path, format=fmt.upper())
+                with Image.open(path) as img:
+                    expected = ((img.format or "").lower(), img.mode, img.width, img.height)
+                self.assertEqual(mod._probe_header(path), expected, msg=path.name)
+
+            gif = root / "anim.gif"
+            Image.new("P", (10, 10)).save(gif)
+            self.assertIsNone(mod._probe_header(gif))
+            self.assertEqual(mod.image_metadata(gif)["format"], "gif")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -36,6 +36,30 @@ class Phase6SchemaTests(unittest.TestCase):
         errors = validate_task_contract_obj(payload, 2)
         self.assertEqual(errors, [])
 
+    def test_validate_task_contract_obj_flags_fields_in_order(self) -> None:
+        payload = {
+            "schema_version": TASK_CONTRACT_SCHEMA_VERSION,
+            "generated_at": True,
+            "round": 2,
+            "pattern": "debate",
+            "objective": "   ",
+            "prompt_sha256": "abc",
+            "constraints": ["ok", ""],
+            "deliverables": ["update file"],
+            "verification": ["python -m pytest -q tests"],
+            "event_horizon": {"mass": "heavy", "split_required": False},
+        }
+        errors = validate_task_contract_obj(payload, 2)
+        self.assertEqual(
+            errors,
+            [
+                "task_contract.generated_at",
+                "task_contract.objective",
+                "task_contract.constraints",
+                "task_contract.event_horizon.mass",
+            ],
+        )
+
     def test_validate_task_pipeline_obj_flags_missing_inputs(self) -> None:
         payload = {
             "schema_version": TASK_PIPELINE_SCHEMA_VERSION,
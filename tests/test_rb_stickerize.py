@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MOD_PATH = REPO_ROOT / "scripts" / "rb_stickerize.py"
+
+
+def load_module(path: Path):
+    spec = importlib.util.spec_from_file_location(path.stem, str(path))
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"unable to load module from {path}")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def full_resize(path: Path, canvas_px: int, padding_pct: float = 0.08) -> np.ndarray:
+    rgba = Image.open(path).convert("RGBA")
+    cropped = rgba.crop(rgba.getchannel("A").getbbox())
+    max_dim = max(cropped.size)
+    pad = int(max_dim * padding_pct)
+    side = max_dim + pad * 2
+    square = Image.new("RGBA", (side, side), (0, 0, 0, 0))
+    square.alpha_composite(cropped, dest=((side - cropped.width) // 2, (side - cropped.height) // 2))
+    return np.asarray(square.resize((canvas_px, canvas_px), Image.Resampling.LANCZOS)).astype(np.int32)
+
+
+def wide_art(width: int, height: int) -> Image.Image:
+    img = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    rng = np.random.RandomState(0)
+    for _ in range(30):
+        x, y = int(rng.randint(0, width)), int(rng.randint(0, height))
+        color = tuple(int(v) for v in rng.randint(0, 256, 3)) + (int(rng.randint(60, 256)),)
+        draw.ellipse([x, y, x + int(rng.randint(5, width // 3)), y + int(rng.randint(5, height // 2))], fill=color)
+    return img
+
+
+class RbStickerizeTests(unittest.TestCase):
+    def assert_matches_full_resize(self, size, canvas_px: int) -> None:
+        mod = load_module(MOD_PATH)
+        with tempfile.TemporaryDirectory() as td:
+            src = Path(td) / "art.png"
+            out = Path(td) / "sticker.png"
+            wide_art(*size).save(src)
+            mod.stickerize(src, out, canvas_px=canvas_px)
+            got = np.asarray(Image.open(out)).astype(np.int32)
+            want = full_resize(src, canvas_px)
+        # Only float rounding of the resample coefficients may differ.
+        self.assertLessEqual(int(np.abs(got[..., 3] - want[..., 3]).max()), 2)
+        premult_got = got[..., :3] * got[..., 3:] / 255.0
+        premult_want = want[..., :3] * want[..., 3:] / 255.0
+        self.assertLessEqual(float(np.abs(premult_got - premult_want).max()), 3.0)
+
+    def test_upscale_matches_full_resize(self) -> None:
+        self.assert_matches_full_resize((300, 80), 1000)
+
+    def test_downscale_matches_full_resize(self) -> None:
+        self.assert_matches_full_resize((1200, 300), 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import importlib.util
 import random
+import tempfile
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -64,6 +67,30 @@ class RbStyleCycleTests(unittest.TestCase):
         self.assertGreaterEqual(int(out["center_jitter_px"]), 0)
         self.assertLessEqual(int(out["center_jitter_px"]), 48)
 
+    def test_evaluate_overrides_pool_matches_serial(self) -> None:
+        mod = load_module(MOD_PATH)
+        themes = ["dunes", "falls", "riverwalk", "ferry dock"]
+
+        def fake_generator(*, concept, out_path, **_kwargs) -> None:
+            # Earlier themes finish last so out-of-order completion would show up.
+            time.sleep(0.01 * (len(themes) - themes.index(concept)))
+            out_path.write_text(concept, encoding="utf-8")
+
+        def fake_analyze(path: Path) -> dict:
+            n = len(path.read_text(encoding="utf-8"))
+            return {"alpha_ratio": 0.01 * n, "edge_density": 0.002 * n, "component_count": n, "flags": []}
+
+        mod.call_lineart_generator = fake_generator
+        mod.analyze_style_image = fake_analyze
+        ref = {"alpha_ratio": {"median": 0.06, "p10": 0.04, "p90": 0.09}}
+        with tempfile.TemporaryDirectory() as td:
+            kwargs = dict(base_profile={}, overrides={}, ref_summary=ref, themes=themes, width=64, height=64)
+            serial = mod.evaluate_overrides(work_dir=Path(td) / "serial", **kwargs)
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                pooled = mod.evaluate_overrides(work_dir=Path(td) / "pooled", pool=pool, **kwargs)
+        self.assertEqual(serial, pooled)
+        self.assertEqual(pooled["sample_count"], len(themes))
+
 
 if __name__ == "__main__":
     unittest.main()